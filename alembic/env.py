@@ -58,7 +58,8 @@ def run_migrations_online() -> None:
             connection=connection, target_metadata=target_metadata
         )
 
-        with connection.begin():
+        # Alembic-managed transaction, so migrations can use autocommit_block()
+        with context.begin_transaction():
             context.run_migrations()
 
 
@@ -0,0 +1,39 @@
+"""add (created_at, id) indexes for keyset pagination
+
+Revision ID: 002_keyset_pagination_indexes
+Revises: 001_add_user_role_field
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '002_keyset_pagination_indexes'
+down_revision = '001_add_user_role_field'
+branch_labels = None
+depends_on = None
+
+# job_postings is created by init_db on fresh installs, so only index it
+# when it already exists.
+INDEXES = [
+    ('idx_users_created_at_id', 'users'),
+    ('idx_job_postings_created_at_id', 'job_postings'),
+]
+
+
+def _has_table(name):
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade():
+    for index_name, table_name in INDEXES:
+        if _has_table(table_name):
+            op.create_index(
+                index_name, table_name, ['created_at', 'id'], if_not_exists=True
+            )
+
+
+def downgrade():
+    for index_name, table_name in INDEXES:
+        if _has_table(table_name):
+            op.drop_index(index_name, table_name=table_name, if_exists=True)
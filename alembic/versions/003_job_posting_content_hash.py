@@ -0,0 +1,31 @@
+"""add content_hash to job_postings for no-op upsert detection
+
+Revision ID: 003_job_posting_content_hash
+Revises: 002_keyset_pagination_indexes
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '003_job_posting_content_hash'
+down_revision = '002_keyset_pagination_indexes'
+branch_labels = None
+depends_on = None
+
+
+def _has_table(name):
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade():
+    # Existing rows keep a NULL hash until their next upsert rewrites them
+    if _has_table('job_postings'):
+        op.add_column(
+            'job_postings', sa.Column('content_hash', sa.String(length=64), nullable=True)
+        )
+
+
+def downgrade():
+    if _has_table('job_postings'):
+        op.drop_column('job_postings', 'content_hash')
@@ -0,0 +1,63 @@
+"""add weighted full-text search vector and GIN index to job_postings
+
+Revision ID: 004_job_posting_search
+Revises: 003_job_posting_content_hash
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '004_job_posting_search'
+down_revision = '003_job_posting_content_hash'
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', job_title), 'A') || "
+    "setweight(to_tsvector('english', description), 'B')"
+)
+
+
+def _has_table(name):
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade():
+    if not _has_table('job_postings'):
+        return
+
+    # Adding a stored generated column rewrites the table under an exclusive
+    # lock; the index is then built without blocking writes.
+    op.add_column(
+        'job_postings',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_job_postings_search_vector',
+            'job_postings',
+            ['search_vector'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    if not _has_table('job_postings'):
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_job_postings_search_vector',
+            table_name='job_postings',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column('job_postings', 'search_vector')
@@ -0,0 +1,110 @@
+"""store skills as normalized JSONB with GIN indexes
+
+Revision ID: 005_jsonb_skills
+Revises: 004_job_posting_search
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '005_jsonb_skills'
+down_revision = '004_job_posting_search'
+branch_labels = None
+depends_on = None
+
+# (table, column, server default)
+SKILL_COLUMNS = [
+    ('job_postings', 'required_skills', None),
+    ('users', 'skills', "'[]'"),
+]
+
+# Lowercased, trimmed and de-duplicated keeping first-seen order, matching
+# app.db.types.normalize_skills so containment lookups are case-insensitive.
+NORMALIZE_SKILLS = """
+UPDATE {table} SET {column} = (
+    SELECT coalesce(jsonb_agg(skill ORDER BY position), '[]'::jsonb)
+    FROM (
+        SELECT skill, min(position) AS position
+        FROM (
+            SELECT lower(btrim(value)) AS skill, position
+            FROM jsonb_array_elements_text({table}.{column})
+                WITH ORDINALITY AS elements(value, position)
+        ) AS cleaned
+        WHERE skill <> ''
+        GROUP BY skill
+    ) AS deduped
+)
+WHERE jsonb_typeof({column}) = 'array'
+"""
+
+
+def _has_table(name):
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def _alter_type(table, column, server_default, type_):
+    if server_default is not None:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT')
+    op.execute(
+        f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_} USING {column}::{type_}'
+    )
+    if server_default is not None:
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} '
+            f'SET DEFAULT {server_default}::{type_}'
+        )
+
+
+def upgrade():
+    columns = [c for c in SKILL_COLUMNS if _has_table(c[0])]
+
+    # The type change rewrites each table under an exclusive lock; the
+    # indexes are then built without blocking writes.
+    for table, column, server_default in columns:
+        _alter_type(table, column, server_default, 'jsonb')
+        op.execute(NORMALIZE_SKILLS.format(table=table, column=column))
+
+    with op.get_context().autocommit_block():
+        for table, column, _ in columns:
+            op.create_index(
+                f'idx_{table}_{column}',
+                table,
+                [column],
+                postgresql_using='gin',
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        if _has_table('job_postings'):
+            op.create_index(
+                'idx_job_postings_budget',
+                'job_postings',
+                ['budget'],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade():
+    columns = [c for c in SKILL_COLUMNS if _has_table(c[0])]
+
+    with op.get_context().autocommit_block():
+        if _has_table('job_postings'):
+            op.drop_index(
+                'idx_job_postings_budget',
+                table_name='job_postings',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+        for table, column, _ in columns:
+            op.drop_index(
+                f'idx_{table}_{column}',
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+    # Skills stay normalized; only the column type is restored
+    for table, column, server_default in columns:
+        _alter_type(table, column, server_default, 'json')
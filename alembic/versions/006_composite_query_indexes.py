@@ -0,0 +1,86 @@
+"""replace single-column indexes with composites matching list queries
+
+Revision ID: 006_composite_query_indexes
+Revises: 005_jsonb_skills
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '006_composite_query_indexes'
+down_revision = '005_jsonb_skills'
+branch_labels = None
+depends_on = None
+
+# (index, table, columns). List queries filter on the leading columns and
+# page over (created_at, id) in either direction, so a forward or backward
+# scan of these returns rows already in order.
+NEW_INDEXES = [
+    (
+        'idx_applications_user_created_at_id',
+        'applications',
+        ['user_id', 'created_at', 'id'],
+    ),
+    (
+        'idx_applications_user_status_created_at_id',
+        'applications',
+        ['user_id', 'status', 'created_at', 'id'],
+    ),
+    (
+        'idx_job_postings_platform_created_at_id',
+        'job_postings',
+        ['platform', 'created_at', 'id'],
+    ),
+    ('idx_users_role_created_at_id', 'users', ['role', 'created_at', 'id']),
+]
+
+# Unused by any query, or a leading prefix of one of the indexes above
+OLD_INDEXES = [
+    ('ix_applications_user_id', 'applications', ['user_id']),
+    ('idx_applications_status', 'applications', ['status']),
+    ('idx_applications_user_status', 'applications', ['user_id', 'status']),
+    ('idx_job_title', 'job_postings', ['job_title']),
+    ('idx_platform', 'job_postings', ['platform']),
+    ('idx_created_at', 'job_postings', ['created_at']),
+]
+
+
+def _has_table(name):
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def _create(indexes):
+    for index_name, table_name, columns in indexes:
+        if _has_table(table_name):
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def _drop(indexes):
+    for index_name, table_name, _ in indexes:
+        if _has_table(table_name):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def upgrade():
+    # Build the replacements before dropping anything they supersede
+    with op.get_context().autocommit_block():
+        _create(NEW_INDEXES)
+        _drop(OLD_INDEXES)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        _create(OLD_INDEXES)
+        _drop(NEW_INDEXES)
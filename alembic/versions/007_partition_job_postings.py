@@ -0,0 +1,222 @@
+"""partition job_postings by month with a job_posting_keys URL registry
+
+Revision ID: 007_partition_job_postings
+Revises: 006_composite_query_indexes
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from datetime import date, datetime, time, timezone
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '007_partition_job_postings'
+down_revision = '006_composite_query_indexes'
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', job_title), 'A') || "
+    "setweight(to_tsvector('english', description), 'B')"
+)
+
+COLUMNS = (
+    'id, platform, job_title, description, budget, required_skills, url, '
+    'content_hash, created_at'
+)
+
+# Future months created up front (JOB_POSTING_PARTITIONS_AHEAD's default)
+PARTITIONS_AHEAD = 3
+
+# (index, columns, using) on job_postings, as of 006
+INDEXES = [
+    ('idx_job_postings_created_at_id', ['created_at', 'id'], None),
+    ('idx_job_postings_platform_created_at_id', ['platform', 'created_at', 'id'], None),
+    ('idx_job_postings_budget', ['budget'], None),
+    ('idx_job_postings_required_skills', ['required_skills'], 'gin'),
+    ('idx_job_postings_search_vector', ['search_vector'], 'gin'),
+]
+
+SYNC_KEYS_FUNCTION = """
+CREATE OR REPLACE FUNCTION job_posting_keys_sync() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO job_posting_keys (id, url) VALUES (NEW.id, NEW.url)
+        ON CONFLICT (id) DO NOTHING;
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE job_posting_keys SET url = NEW.url WHERE id = NEW.id;
+    ELSE
+        DELETE FROM job_posting_keys WHERE id = OLD.id;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+SYNC_KEYS_TRIGGERS = [
+    "CREATE TRIGGER job_posting_keys_insert AFTER INSERT ON job_postings "
+    "FOR EACH ROW EXECUTE FUNCTION job_posting_keys_sync()",
+    "CREATE TRIGGER job_posting_keys_update AFTER UPDATE OF url ON job_postings "
+    "FOR EACH ROW WHEN (OLD.url IS DISTINCT FROM NEW.url) "
+    "EXECUTE FUNCTION job_posting_keys_sync()",
+    "CREATE TRIGGER job_posting_keys_delete AFTER DELETE ON job_postings "
+    "FOR EACH ROW EXECUTE FUNCTION job_posting_keys_sync()",
+]
+
+
+def _has_table(name):
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def _add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes():
+    for index_name, columns, using in INDEXES:
+        op.create_index(
+            index_name,
+            'job_postings',
+            columns,
+            **({'postgresql_using': using} if using else {}),
+        )
+
+
+def _job_postings_columns(primary_key):
+    return [
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            'platform',
+            postgresql.ENUM(name='platform_enum', create_type=False),
+            nullable=False,
+        ),
+        sa.Column('job_title', sa.String(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('budget', sa.DECIMAL(), nullable=True),
+        sa.Column('required_skills', postgresql.JSONB(), nullable=False),
+        sa.Column('url', sa.String(), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=True),
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint(*primary_key, name='job_postings_pkey'),
+    ]
+
+
+def _set_application_fk(target, validate=True):
+    if not _has_table('applications'):
+        return
+    op.drop_constraint(
+        'applications_job_posting_id_fkey', 'applications', type_='foreignkey'
+    )
+    op.execute(
+        'ALTER TABLE applications ADD CONSTRAINT applications_job_posting_id_fkey '
+        f'FOREIGN KEY (job_posting_id) REFERENCES {target} (id) ON DELETE CASCADE'
+        + ('' if validate else ' NOT VALID')
+    )
+
+
+def upgrade():
+    if not _has_table('job_postings'):
+        return
+
+    # Everything runs in one transaction under an exclusive lock on
+    # job_postings, so URL dedup never sees a half-migrated table. The
+    # rows are copied once: schedule this for a quiet period.
+    op.execute('LOCK TABLE job_postings IN EXCLUSIVE MODE')
+
+    op.create_table(
+        'job_posting_keys',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('url', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('url'),
+    )
+    op.execute('INSERT INTO job_posting_keys (id, url) SELECT id, url FROM job_postings')
+    _set_application_fk('job_posting_keys')
+
+    op.rename_table('job_postings', 'job_postings_unpartitioned')
+    op.execute('ALTER INDEX job_postings_pkey RENAME TO job_postings_unpartitioned_pkey')
+    for index_name, _, _ in INDEXES:
+        op.drop_index(index_name, table_name='job_postings_unpartitioned')
+
+    op.create_table(
+        'job_postings',
+        *_job_postings_columns(['id', 'created_at']),
+        postgresql_partition_by='RANGE (created_at)',
+    )
+    op.execute('CREATE TABLE job_postings_default PARTITION OF job_postings DEFAULT')
+
+    first = op.get_bind().scalar(
+        sa.text('SELECT min(created_at) FROM job_postings_unpartitioned')
+    )
+    today = datetime.now(timezone.utc).date()
+    first = first.astimezone(timezone.utc).date() if first is not None else today
+    month = date(first.year, first.month, 1)
+    last = _add_months(date(today.year, today.month, 1), PARTITIONS_AHEAD)
+    while month <= last:
+        start, end = (
+            datetime.combine(bound, time(), tzinfo=timezone.utc)
+            for bound in (month, _add_months(month, 1))
+        )
+        op.execute(
+            f'CREATE TABLE job_postings_y{month.year:04d}m{month.month:02d} '
+            f"PARTITION OF job_postings FOR VALUES FROM ('{start.isoformat()}') "
+            f"TO ('{end.isoformat()}')"
+        )
+        month = _add_months(month, 1)
+
+    op.execute(
+        f'INSERT INTO job_postings ({COLUMNS}) '
+        f'SELECT {COLUMNS} FROM job_postings_unpartitioned'
+    )
+    op.drop_table('job_postings_unpartitioned')
+
+    _create_indexes()
+    op.create_index('idx_job_postings_url', 'job_postings', ['url'])
+
+    op.execute(SYNC_KEYS_FUNCTION)
+    for trigger in SYNC_KEYS_TRIGGERS:
+        op.execute(trigger)
+
+
+def downgrade():
+    if not _has_table('job_posting_keys'):
+        return
+
+    op.execute('LOCK TABLE job_postings IN EXCLUSIVE MODE')
+    op.execute('DROP FUNCTION job_posting_keys_sync() CASCADE')
+
+    op.rename_table('job_postings', 'job_postings_partitioned')
+    op.execute('ALTER INDEX job_postings_pkey RENAME TO job_postings_partitioned_pkey')
+    op.drop_index('idx_job_postings_url', table_name='job_postings_partitioned')
+    for index_name, _, _ in INDEXES:
+        op.drop_index(index_name, table_name='job_postings_partitioned')
+
+    op.create_table(
+        'job_postings',
+        *_job_postings_columns(['id']),
+        sa.UniqueConstraint('url'),
+    )
+    op.execute(
+        f'INSERT INTO job_postings ({COLUMNS}) '
+        f'SELECT {COLUMNS} FROM job_postings_partitioned'
+    )
+    op.drop_table('job_postings_partitioned')
+    _create_indexes()
+
+    # Applications of archived postings no longer have a posting to point
+    # to, so existing rows are not checked
+    _set_application_fk('job_postings', validate=False)
+    op.drop_table('job_posting_keys')
@@ -2,29 +2,45 @@
 
 from typing import List
 from uuid import UUID
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_current_admin_user
+from app.core.principal_cache import principal_cache
+from app.core.security import get_current_admin_user, verified_token_cache
 from app.core.exceptions import AppException
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db, pool_stats
 from app.db.models.user import UserRole
 from app.api.v1.schemas.user import UserResponse
 from app.services.user_service import UserService
+from app.utils.pagination import TOTAL_COUNT_HEADER
 
 router = APIRouter()
 
 
 @router.get("/users", response_model=List[UserResponse])
 async def list_all_users(
+    response: Response,
     current_user: dict = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """List all users (admin only)."""
+    """List all users (admin only, approximate total in X-Total-Count)."""
     user_service = UserService(db)
+    response.headers[TOTAL_COUNT_HEADER] = str(await user_service.count_users())
     return await user_service.get_all_users()
 
 
+@router.get("/metrics")
+async def get_metrics(
+    current_user: dict = Depends(get_current_admin_user),
+):
+    """Get in-process cache and database metrics (admin only)."""
+    return {
+        "principal_cache": principal_cache.stats(),
+        "jwt_cache": verified_token_cache.stats(),
+        "database_pool": pool_stats(),
+    }
+
+
 @router.patch("/users/{user_id}/role", response_model=UserResponse)
 async def update_user_role(
     user_id: UUID,
@@ -1,21 +1,23 @@
 """Application endpoints."""
 
-from typing import Literal, Optional
+from typing import Literal, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.application import (
     ApplicationCreate,
     ApplicationResponse,
+    ApplicationSummary,
     ApplicationUpdate,
 )
 from app.core.exceptions import AppException, NotFoundError
 from app.core.security import get_current_user
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.db.models.application import ApplicationStatus
 from app.services.application_service import ApplicationService
+from app.utils.pagination import NEXT_CURSOR_HEADER, next_cursor
 
 router = APIRouter()
 
@@ -35,20 +37,29 @@ async def create_application(
         raise e
 
 
-@router.get("", response_model=list[ApplicationResponse])
+@router.get("", response_model=list[Union[ApplicationResponse, ApplicationSummary]])
 async def get_applications(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     status: ApplicationStatus = Query(None),
     sort: Literal["asc", "desc"] = Query("desc"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    view: Literal["full", "summary"] = Query("full"),
+    include: Optional[Literal["job"]] = Query(None),
+    db: AsyncSession = Depends(get_read_db),
     current_user: dict = Depends(get_current_user),
 ):
     try:
         application_service = ApplicationService(db)
-        return await application_service.get_applications(
-            current_user["user_id"], skip, limit, status, sort
+        applications = await application_service.get_applications(
+            current_user["user_id"], skip, limit, status, sort, cursor, view, include
         )
+
+        if cursor_value := next_cursor(applications, limit):
+            response.headers[NEXT_CURSOR_HEADER] = cursor_value
+
+        return applications
     except AppException as e:
         raise e
 
@@ -56,7 +67,7 @@ async def get_applications(
 @router.get("/{application_id}", response_model=ApplicationResponse)
 async def get_application(
     application_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: dict = Depends(get_current_user),
 ):
     try:
@@ -1,51 +1,113 @@
 """Jobs endpoints."""
 
+from datetime import datetime
+from typing import List, Literal, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.job import (
-    JobPostingCreate,
+    JobPostingBatch,
+    JobPostingBatchResponse,
     JobPostingResponse,
+    JobPostingSearchResult,
+    JobPostingSummary,
     JobPostingUpsert,
+    JobPostingUpsertResponse,
 )
 from app.core.exceptions import AppException, NotFoundError
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
+from app.db.models.job import PlatformEnum
 from app.services.job_service import JobPostingService
+from app.utils.pagination import NEXT_CURSOR_HEADER, next_cursor, next_rank_cursor
 
 router = APIRouter()
 
 
-@router.post("", response_model=JobPostingResponse)
+@router.post("", response_model=JobPostingUpsertResponse)
 async def create_jobposting(
     payload: JobPostingUpsert,
     db: AsyncSession = Depends(get_db),
 ):
     try:
         jobposting_service = JobPostingService(db)
-        jobposting = await jobposting_service.repository.get_by_url(str(payload.url))
-
-        if jobposting is not None:
-            return await jobposting_service.update_jobposting(
-                UUID(str(jobposting.id)), payload
-            )
-        else:
-            job_data = JobPostingCreate(**payload.model_dump())
-            return await jobposting_service.create_jobposting(job_data)
+        return await jobposting_service.upsert_jobposting(payload)
     except AppException as e:
         raise e
 
 
-@router.get("", response_model=list[JobPostingResponse])
+@router.post("/batch", response_model=JobPostingBatchResponse)
+async def create_jobpostings_batch(
+    payload: JobPostingBatch,
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        jobposting_service = JobPostingService(db)
+        return await jobposting_service.upsert_jobpostings(payload)
+    except AppException as e:
+        raise e
+
+
+@router.get("", response_model=list[Union[JobPostingResponse, JobPostingSummary]])
 async def get_jobpostings(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    view: Literal["full", "summary"] = Query("full"),
+    skills_any: Optional[List[str]] = Query(None),
+    skills_all: Optional[List[str]] = Query(None),
+    platform: Optional[List[PlatformEnum]] = Query(None),
+    budget_min: Optional[float] = Query(None, ge=0),
+    budget_max: Optional[float] = Query(None, ge=0),
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+):
+    try:
+        jobposting_service = JobPostingService(db)
+        jobpostings = await jobposting_service.get_jobpostings(
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            view=view,
+            skills_any=skills_any,
+            skills_all=skills_all,
+            platforms=platform,
+            budget_min=budget_min,
+            budget_max=budget_max,
+            created_after=created_after,
+            created_before=created_before,
+        )
+
+        if cursor_value := next_cursor(jobpostings, limit):
+            response.headers[NEXT_CURSOR_HEADER] = cursor_value
+
+        return jobpostings
+    except AppException as e:
+        raise e
+
+
+@router.get("/search", response_model=list[JobPostingSearchResult])
+async def search_jobpostings(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    platform: Optional[List[PlatformEnum]] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_read_db),
 ):
     try:
         jobposting_service = JobPostingService(db)
-        return await jobposting_service.get_jobpostings(skip=skip, limit=limit)
+        results = await jobposting_service.search_jobpostings(
+            q, platforms=platform, limit=limit, cursor=cursor
+        )
+
+        if cursor_value := next_rank_cursor(results, limit):
+            response.headers[NEXT_CURSOR_HEADER] = cursor_value
+
+        return results
     except AppException as e:
         raise e
 
@@ -53,7 +115,7 @@ async def get_jobpostings(
 @router.get("/{job_id}", response_model=JobPostingResponse)
 async def get_jobposting(
     job_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     try:
         jobposting_service = JobPostingService(db)
@@ -1,15 +1,16 @@
 """User endpoints."""
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import get_current_user
 from app.core.exceptions import AppException, UnauthorizedError
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.api.v1.schemas.user import UserResponse, UserUpdate
 from app.services.user_service import UserService
+from app.utils.pagination import NEXT_CURSOR_HEADER, next_cursor
 
 router = APIRouter()
 
@@ -17,7 +18,7 @@ router = APIRouter()
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
     current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get current user information."""
     user_id = current_user.get("user_id")
@@ -34,26 +35,33 @@ async def get_current_user_info(
 
 @router.get("/", response_model=List[UserResponse])
 async def get_users(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """Get list of users (paginated)."""
+    """Get list of users (paginated, next page cursor in X-Next-Cursor)."""
     user_id = current_user.get("user_id")
     
     if not user_id:
         raise UnauthorizedError("User ID not found in token")
     
     user_service = UserService(db)
-    return await user_service.get_users(skip=skip, limit=limit)
+    users = await user_service.get_users(skip=skip, limit=limit, cursor=cursor)
+
+    if cursor_value := next_cursor(users, limit):
+        response.headers[NEXT_CURSOR_HEADER] = cursor_value
+
+    return users
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: UUID,
     current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get user by ID."""
     
@@ -3,9 +3,11 @@ from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 
+from app.api.v1.schemas.job import JobPostingBrief
 from app.db.models.application import ApplicationStatus
+from app.utils.preview import truncate_preview
 
 
 class ApplicationBase(BaseModel):
@@ -33,5 +35,26 @@ class ApplicationResponse(ApplicationBase):
     user_id: UUID
     created_at: datetime
     updated_at: datetime
+    # Only with include=job; also None once the posting is archived
+    job: Optional[JobPostingBrief] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ApplicationSummary(BaseModel):
+    """List item for view=summary: a proposal preview instead of the text."""
+
+    id: UUID
+    user_id: UUID
+    job_posting_id: UUID
+    status: Optional[ApplicationStatus]
+    bid_amount: Optional[Decimal]
+    submitted_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+    proposal_preview: str
+    job: Optional[JobPostingBrief] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    _truncate_preview = field_validator("proposal_preview")(truncate_preview)
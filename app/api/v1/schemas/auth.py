@@ -1,8 +1,9 @@
 """Authentication schemas."""
 
-from pydantic import BaseModel, EmailStr, HttpUrl
+from pydantic import BaseModel, EmailStr, HttpUrl, field_validator
 from typing import List
 from app.api.v1.schemas.user import UserResponse
+from app.db.types import normalize_skills
 
 
 class Token(BaseModel):
@@ -32,6 +33,8 @@ class UserCreate(BaseModel):
     portfolio_links: List[HttpUrl]
     preferred_rate: float
 
+    _normalize_skills = field_validator("skills")(normalize_skills)
+
     # This updates the "Example Value" in Swagger UI
     model_config = {
         "json_schema_extra": {
@@ -2,9 +2,12 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
+from app.core.config import settings
 from app.db.models.job import PlatformEnum
+from app.db.types import normalize_skills
+from app.utils.preview import truncate_preview
 
 
 class JobPostingBase(BaseModel):
@@ -15,6 +18,8 @@ class JobPostingBase(BaseModel):
     required_skills: List[str]
     url: HttpUrl
 
+    _normalize_skills = field_validator("required_skills")(normalize_skills)
+
 
 class JobPostingUpsert(BaseModel):
     url: HttpUrl
@@ -25,6 +30,8 @@ class JobPostingUpsert(BaseModel):
     budget: Optional[float] = None
     required_skills: Optional[List[str]] = None
 
+    _normalize_skills = field_validator("required_skills")(normalize_skills)
+
 
 class JobPostingCreate(JobPostingBase):
     pass
@@ -35,3 +42,58 @@ class JobPostingResponse(JobPostingBase):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class JobPostingBrief(BaseModel):
+    """A job posting's short columns, e.g. embedded in an application."""
+
+    id: UUID
+    platform: PlatformEnum
+    job_title: str
+    budget: Optional[float] = None
+    required_skills: List[str]
+    url: HttpUrl
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class JobPostingSummary(JobPostingBrief):
+    """List item for view=summary: a description preview instead of the text."""
+
+    description_preview: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+    _truncate_preview = field_validator("description_preview")(truncate_preview)
+
+
+class JobPostingSearchResult(JobPostingSummary):
+    """Search hit: a job posting summary and its relevance."""
+
+    rank: float
+
+
+class JobPostingUpsertResponse(JobPostingResponse):
+    created: bool
+    changed: bool
+
+
+class JobPostingBatch(BaseModel):
+    items: List[JobPostingCreate] = Field(
+        ..., min_length=1, max_length=settings.JOB_BATCH_MAX_SIZE
+    )
+
+
+class JobPostingBatchItemResult(BaseModel):
+    url: str
+    id: UUID
+    created: bool
+    changed: bool
+
+
+class JobPostingBatchResponse(BaseModel):
+    results: List[JobPostingBatchItemResult]
+    created: int
+    updated: int
+    unchanged: int
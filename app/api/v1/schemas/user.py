@@ -2,9 +2,11 @@ from datetime import datetime
 from uuid import UUID
 from decimal import Decimal
 from typing import List, Optional
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, HttpUrl, field_validator
 from enum import Enum
 
+from app.db.types import normalize_skills
+
 
 class UserRole(str, Enum):
     USER = "user"
@@ -25,6 +27,8 @@ class UserCreate(BaseModel):
     portfolio_links: List[HttpUrl] = Field(default_factory=list)
     preferred_rate: Optional[Decimal] = Field(None, max_digits=10, decimal_places=2)
 
+    _normalize_skills = field_validator("skills")(normalize_skills)
+
 # --- Update Schema ---
 class UserUpdate(BaseModel):
     """
@@ -43,6 +47,8 @@ class UserUpdate(BaseModel):
     portfolio_links: Optional[List[HttpUrl]] = None
     preferred_rate: Optional[Decimal] = Field(None, gt=0, description="Hourly rate must be positive")
 
+    _normalize_skills = field_validator("skills")(normalize_skills)
+
 # --- Read/Response Schema ---
 class UserResponse(BaseModel):
     id: UUID
@@ -1,10 +1,15 @@
 """Application configuration management."""
 
 import json
-from typing import List, Optional
+from typing import List, Optional, Union
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# A list read from the environment as JSON or comma-separated values. The
+# settings source JSON-decodes plain List fields and fails on anything else;
+# with the str arm it passes those values on to Settings.parse_list
+EnvList = Union[List[str], str]
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -21,6 +26,11 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    JWT_CACHE_MAX_SIZE: int = 10000
+
+    # Password hashing (bcrypt runs in a bounded worker pool)
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
 
     # Admin User (created on startup)
     ADMIN_EMAIL: Optional[str] = None
@@ -29,10 +39,10 @@ class Settings(BaseSettings):
     ADMIN_FULL_NAME: str = "Site Administrator"
 
     # CORS
-    CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:8000"]
-    ALLOWED_HOSTS: List[str] = ["*"]
+    CORS_ORIGINS: EnvList = ["http://localhost:3000", "http://localhost:8000"]
+    ALLOWED_HOSTS: EnvList = ["*"]
 
-    @field_validator("CORS_ORIGINS", "ALLOWED_HOSTS", mode="before")
+    @field_validator("CORS_ORIGINS", "ALLOWED_HOSTS", "DATABASE_READ_URLS", mode="before")
     @classmethod
     def parse_list(cls, v):
         """Parse JSON string or return list."""
@@ -40,22 +50,52 @@ class Settings(BaseSettings):
             try:
                 return json.loads(v)
             except json.JSONDecodeError:
-                return [item.strip() for item in v.split(",")]
+                return [item.strip() for item in v.split(",") if item.strip()]
         return v
 
     # Database
     DATABASE_URL: str
     DATABASE_ECHO: bool = False
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0  # seconds to wait for a free connection
+    DATABASE_POOL_RECYCLE: int = -1  # seconds; -1 never recycles
+    DATABASE_POOL_PRE_PING: bool = False
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statements per connection
+    # Set when DATABASE_URL points at PgBouncer in transaction pooling mode:
+    # disables prepared statement caching and the local pool (pool settings unused)
+    DATABASE_PGBOUNCER: bool = False
+    DATABASE_READ_URLS: EnvList = []
+    DATABASE_READ_YOUR_WRITES_SECONDS: int = 5
+    # Per-request SQL instrumentation: warn when a request runs more statements
+    # than the budget, or the same statement more than the repeat limit (N+1)
+    DATABASE_QUERY_BUDGET: int = 20  # 0 disables
+    DATABASE_QUERY_REPEAT_LIMIT: int = 5  # 0 disables
 
     # Redis (optional)
     REDIS_URL: Optional[str] = None
 
+    # Principal cache (role/is_admin lookups for authenticated requests)
+    PRINCIPAL_CACHE_TTL: int = 300  # seconds, Redis tier
+    PRINCIPAL_CACHE_LOCAL_TTL: int = 5  # seconds, in-process tier
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+
     # Logging
     LOG_LEVEL: str = "INFO"
 
     # Pagination
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
+    COUNT_CACHE_TTL: int = 60  # seconds
+    LIST_PREVIEW_LENGTH: int = 200  # characters of long text in view=summary lists
+
+    # Job ingestion
+    JOB_BATCH_MAX_SIZE: int = 100
+
+    # Job posting partitions (one per month, see app.db.partitions)
+    JOB_POSTING_PARTITIONS_AHEAD: int = 3  # future months kept ready
+    JOB_POSTING_RETENTION_MONTHS: int = 6  # older months are archived
+    JOB_POSTING_ARCHIVE_DIR: str = "archive/job_postings"
 
     model_config = SettingsConfigDict(
         env_file=".env",
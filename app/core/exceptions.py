@@ -48,6 +48,13 @@ class ForbiddenError(AppException):
         super().__init__(message, status_code=status.HTTP_403_FORBIDDEN)
 
 
+class ServiceUnavailableError(AppException):
+    """Service temporarily unavailable exception."""
+    
+    def __init__(self, message: str = "Service temporarily unavailable"):
+        super().__init__(message, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
 async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
     """Handle application exceptions."""
     logger.error(f"Application error: {exc.message}", exc_info=True)
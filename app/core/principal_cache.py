@@ -0,0 +1,105 @@
+"""Two-tier cache for the authorization fields of authenticated users."""
+
+import logging
+from typing import Optional
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.redis import redis_client
+from app.utils.cache import TTLCache, cache_delete, cache_get, cache_set
+
+logger = logging.getLogger(__name__)
+
+
+class PrincipalCache:
+    """
+    Cache of ``role``/``is_admin`` per user id.
+
+    Lookups hit a short-lived in-process LRU first, then Redis (when
+    connected), so authenticated requests don't need a users-table read.
+    Writers must call ``invalidate`` once a change to a user is committed
+    (see ``app.db.database.after_commit``); other workers may serve their
+    local copy for up to ``local_ttl`` seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: int, local_ttl: int):
+        """
+        Initialize principal cache.
+
+        Args:
+            maxsize: Maximum entries in the in-process tier
+            ttl: Redis entry lifetime in seconds
+            local_ttl: In-process entry lifetime in seconds
+        """
+        self.ttl = ttl
+        self.local = TTLCache(maxsize=maxsize, ttl=local_ttl)
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(user_id: UUID | str) -> str:
+        return f"principal:{user_id}"
+
+    async def get(self, user_id: UUID | str) -> Optional[dict]:
+        """Get a cached principal or None."""
+        key = self._key(user_id)
+        principal = self.local.get(key)
+        if principal is not None:
+            self.local_hits += 1
+            return principal
+
+        if redis_client.redis:
+            try:
+                principal = await cache_get(key)
+            except Exception as e:
+                logger.warning(f"Principal cache read failed: {e}")
+                principal = None
+            if principal is not None:
+                self.redis_hits += 1
+                self.local.set(key, principal)
+                return principal
+
+        self.misses += 1
+        return None
+
+    async def set(self, user_id: UUID | str, principal: dict) -> None:
+        """Store a principal in both tiers."""
+        key = self._key(user_id)
+        self.local.set(key, principal)
+        if redis_client.redis:
+            try:
+                await cache_set(key, principal, ttl=self.ttl)
+            except Exception as e:
+                logger.warning(f"Principal cache write failed: {e}")
+
+    async def invalidate(self, user_id: UUID | str) -> None:
+        """Drop a principal from both tiers."""
+        key = self._key(user_id)
+        self.invalidations += 1
+        self.local.pop(key)
+        if redis_client.redis:
+            try:
+                await cache_delete(key)
+            except Exception as e:
+                logger.warning(f"Principal cache invalidation failed: {e}")
+
+    def stats(self) -> dict:
+        """Hit/miss counters."""
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_ratio": (lookups - self.misses) / lookups if lookups else 0.0,
+            "local_size": len(self.local),
+        }
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL,
+    local_ttl=settings.PRINCIPAL_CACHE_LOCAL_TTL,
+)
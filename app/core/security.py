@@ -1,15 +1,22 @@
 """Security utilities for authentication and authorization."""
 
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
 from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableError
+from app.core.principal_cache import principal_cache
 from app.db.database import get_db
 from app.db.repositories.user_repository import UserRepository
+from app.utils.cache import TTLCache
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -27,6 +34,76 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHashPool:
+    """Bounded worker pool that keeps bcrypt off the event loop."""
+
+    def __init__(self, max_workers: int, max_pending: int):
+        """
+        Initialize password hash pool.
+
+        Args:
+            max_workers: Number of hashing threads
+            max_pending: Calls allowed to wait once all workers are busy
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of running plus queued hashing calls."""
+        return self._in_flight
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a hashing function in the pool.
+
+        Raises:
+            ServiceUnavailableError: If the admission queue is full
+        """
+        if self._in_flight >= self.max_workers + self.max_pending:
+            raise ServiceUnavailableError(
+                "Authentication is temporarily overloaded, please retry"
+            )
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash without blocking the event loop."""
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await password_hash_pool.run(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -49,11 +126,57 @@ def create_refresh_token(data: dict) -> str:
     return encoded_jwt
 
 
+class VerifiedTokenCache:
+    """Memoizes verified JWT claims, keyed by token digest, until ``exp``."""
+
+    def __init__(self, maxsize: int, clock: Callable[[], float] = time.time):
+        """
+        Initialize verified token cache.
+
+        Args:
+            maxsize: Maximum number of memoized tokens
+            clock: Current Unix time, compared with ``exp``
+        """
+        self.clock = clock
+        self._cache = TTLCache(maxsize=maxsize, clock=clock)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        """Get a copy of the claims for a still-valid token, or None."""
+        payload = self._cache.get(self._key(token))
+        if payload is None or payload["exp"] <= self.clock():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return dict(payload)
+
+    def set(self, token: str, payload: dict) -> None:
+        """Memoize claims until the token expires."""
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            self._cache.set(self._key(token), dict(payload), ttl=exp - self.clock())
+
+    def stats(self) -> dict:
+        """Hit/miss counters."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache)}
+
+
+verified_token_cache = VerifiedTokenCache(maxsize=settings.JWT_CACHE_MAX_SIZE)
+
+
 def decode_token(token: str) -> dict:
-    """Decode a JWT token."""
+    """Decode a JWT token, reusing claims already verified for it."""
+    payload = verified_token_cache.get(token)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -61,6 +184,9 @@ def decode_token(token: str) -> dict:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    verified_token_cache.set(token, payload)
+    return payload
+
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
@@ -82,11 +208,18 @@ async def get_current_user(
             user_id = None
 
     if user_id:
-        user_repository = UserRepository(db)
-        user = await user_repository.get_by_id(user_id)
-        if user:
-            payload["role"] = user.role.value if user.role else "user"
-            payload["is_admin"] = user.is_admin
+        principal = await principal_cache.get(user_id)
+        if principal is None:
+            user_repository = UserRepository(db)
+            user = await user_repository.get_by_id(user_id)
+            if user:
+                principal = {
+                    "role": user.role.value if user.role else "user",
+                    "is_admin": user.is_admin,
+                }
+                await principal_cache.set(user_id, principal)
+        if principal:
+            payload.update(principal)
 
     return payload
 
@@ -1,41 +1,439 @@
 """Database connection and session management."""
 
+import hashlib
+import itertools
 import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from uuid import uuid4
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import declarative_base
+from fastapi import Request
+from sqlalchemy import Table, event, exc, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import NullPool
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.sql.selectable import CTE
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
+from app.core.redis import redis_client
+from app.db.pool import InstrumentedAsyncQueuePool
+from app.utils.cache import TTLCache, cache_get, cache_set
 
 logger = logging.getLogger(__name__)
 
+
+def _unique_statement_name() -> str:
+    """Prepared statement name that cannot collide across client connections."""
+    return f"__asyncpg_{uuid4()}__"
+
+
+def _pool_options() -> Dict[str, Any]:
+    """Pool and driver options for the configured deployment mode."""
+    if settings.DATABASE_PGBOUNCER:
+        # Transaction pooling hands each transaction to any server connection:
+        # statements prepared earlier may be missing there, and asyncpg's
+        # sequential names may already be taken by another client. PgBouncer
+        # does the pooling, so connections are not held here either.
+        return {
+            "poolclass": NullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": _unique_statement_name,
+            },
+        }
+    return {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "connect_args": {
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE
+        },
+    }
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    """Create an async engine with the application's engine settings."""
+    return create_async_engine(
+        url,
+        echo=settings.DATABASE_ECHO,
+        future=True,
+        **_pool_options(),
+    )
+
+
+def _create_session_factory(
+    bind: AsyncEngine, **kwargs
+) -> async_sessionmaker[AsyncSession]:
+    """Create an async session factory bound to an engine."""
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+        **kwargs,
+    )
+
+
+def _create_read_session_factory(
+    bind: AsyncEngine, snapshot: bool = False
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Create a session factory for read-only endpoints.
+
+    By default every statement runs in autocommit mode, so a read costs no
+    BEGIN/COMMIT round trips. With ``snapshot`` the session instead runs in a
+    single REPEATABLE READ, READ ONLY transaction, for handlers whose
+    statements must all see the same data. Either way, writes are rejected.
+    """
+    if snapshot:
+        bind = bind.execution_options(
+            isolation_level="REPEATABLE READ", postgresql_readonly=True
+        )
+    else:
+        bind = bind.execution_options(isolation_level="AUTOCOMMIT")
+    return _create_session_factory(bind, info={"read_only": True})
+
+
 # Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DATABASE_ECHO,
-    future=True,
-)
+engine = _create_engine(settings.DATABASE_URL)
+
+# Create async session factories
+AsyncSessionLocal = _create_session_factory(engine)
+AsyncReadSessionLocal = _create_read_session_factory(engine)
+AsyncSnapshotSessionLocal = _create_read_session_factory(engine, snapshot=True)
 
-# Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
+# Read replicas (optional), used round-robin by get_read_db
+read_engines = [_create_engine(url) for url in settings.DATABASE_READ_URLS]
+read_session_factories = [_create_read_session_factory(e) for e in read_engines]
+snapshot_session_factories = [
+    _create_read_session_factory(e, snapshot=True) for e in read_engines
+]
+_read_counter = itertools.count()
+
+# Requesters that wrote recently, pinned to the primary for reads
+_recent_writers = TTLCache(
+    maxsize=100_000, ttl=settings.DATABASE_READ_YOUR_WRITES_SECONDS
 )
 
-# Base class for models
-Base = declarative_base()
 
+def _engine_pool_stats(bind: AsyncEngine) -> Dict[str, Any]:
+    """Pool statistics for one engine (only the instrumented pool has them)."""
+    pool = bind.sync_engine.pool
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        return pool.stats()
+    return {"pool_class": type(pool).__name__}
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Connection pool statistics for the primary and replica engines."""
+    return {
+        "primary": _engine_pool_stats(engine),
+        "replicas": [_engine_pool_stats(e) for e in read_engines],
+    }
+
+
+@dataclass
+class QueryStats:
+    """SQL statements run while tracking (see ``track_queries``)."""
+
+    count: int = 0
+    duration: float = 0.0  # seconds
+    statements: Counter = field(default_factory=Counter)
+
+    def repeated(self, limit: int) -> List[Tuple[str, int]]:
+        """Statements run more than limit times, most repeated first."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count > limit
+        ]
+
+
+# Stats of the tracking blocks the current task is in, innermost last
+_query_stats: ContextVar[Tuple[QueryStats, ...]] = ContextVar("query_stats", default=())
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count the SQL statements run in a block, and their time.
+
+    Statements are attributed through a context variable, so they count for
+    the task that awaits them (and the tasks it starts), whatever engine or
+    session runs them. Blocks nest: statements count for every enclosing
+    block.
+    """
+    stats = QueryStats()
+    token = _query_stats.set(_query_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    tracking = _query_stats.get()
+    if not tracking:
+        return
+    for stats in tracking:
+        stats.count += 1
+        # Parameters are bound separately, so the text is the statement's shape
+        stats.statements[statement] += 1
+    context._query_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _end_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    for stats in _query_stats.get():
+        stats.duration += elapsed
+
+
+class QueryStatsMiddleware:
+    """
+    Report each request's SQL statement count and time.
+
+    Adds a ``Server-Timing: db;dur=<ms>;desc="<n> queries"`` header and logs
+    a warning when a request exceeds DATABASE_QUERY_BUDGET statements or
+    runs one statement more than DATABASE_QUERY_REPEAT_LIMIT times, which
+    usually means an N+1 loop.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f"db;dur={stats.duration * 1000:.1f};"
+                    f'desc="{stats.count} queries"',
+                )
+            await send(message)
+
+        with track_queries() as stats:
+            await self.app(scope, receive, send_with_timing)
+
+        route = scope.get("route")
+        name = f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+        budget = settings.DATABASE_QUERY_BUDGET
+        if budget and stats.count > budget:
+            logger.warning(
+                f"{name} ran {stats.count} SQL statements "
+                f"({stats.duration * 1000:.1f}ms), over the budget of {budget}"
+            )
+        if settings.DATABASE_QUERY_REPEAT_LIMIT:
+            for statement, count in stats.repeated(
+                settings.DATABASE_QUERY_REPEAT_LIMIT
+            ):
+                logger.warning(
+                    f"{name} ran the same SQL statement {count} times "
+                    f"(possible N+1): {' '.join(statement.split())[:200]}"
+                )
+
+
+class Base(DeclarativeBase):
+    """Base class for models."""
+
+    if TYPE_CHECKING:
+        # Models are declared with Column on one Table each; every model has
+        # an id, and the paginated ones a created_at (see BaseRepository)
+        __table__: ClassVar[Table]
+        id: Any
+        created_at: Any
+
+
+def _reject_read_only(session: Session) -> None:
+    if session.info.get("read_only"):
+        raise exc.InvalidRequestError(
+            "Write attempted in a read-only session; use get_db instead"
+        )
+
+
+# Textual SQL that starts like this only reads
+_READ_ONLY_TEXT = re.compile(r"\s*(SELECT|EXPLAIN|SHOW|VALUES|TABLE)\b", re.IGNORECASE)
+
+
+def _may_write(statement) -> bool:
+    """
+    Whether a statement other than a top-level INSERT/UPDATE/DELETE writes.
+
+    Catches INSERT/UPDATE/DELETE common table expressions (e.g. WITH
+    inserted AS (INSERT ... RETURNING ...) SELECT ...) and treats textual
+    SQL as a write unless it starts with a read-only keyword. A SELECT that
+    calls a function with side effects cannot be told apart from a read:
+    set ``session.info["has_writes"]`` for those.
+    """
+    if isinstance(statement, TextClause):
+        return not _READ_ONLY_TEXT.match(statement.text)
+    return any(
+        isinstance(element, CTE) and isinstance(element.element, UpdateBase)
+        for element in visitors.iterate(statement)
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_dml(orm_execute_state) -> None:
+    """Flag sessions that ran INSERT/UPDATE/DELETE statements."""
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+        or _may_write(orm_execute_state.statement)
+    ):
+        _reject_read_only(orm_execute_state.session)
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "before_flush")
+def _check_flush(session, flush_context, instances) -> None:
+    """Refuse to flush pending changes from read-only sessions."""
+    _reject_read_only(session)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context) -> None:
+    """Flag sessions that flushed pending changes."""
+    session.info["has_writes"] = True
+
+
+def _has_writes(session: AsyncSession) -> bool:
+    """Whether a session wrote, or holds changes a commit would flush."""
+    return bool(
+        session.info.get("has_writes")
+        or session.new
+        or session.dirty
+        or session.deleted
+    )
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[Any]]) -> None:
+    """
+    Run a callback once ``get_db`` has committed the session.
+
+    For side effects that must not be seen before the data is, e.g.
+    dropping cache entries of the written rows: done earlier, a concurrent
+    reader could cache the old rows again. Callbacks are dropped if the
+    transaction rolls back; their own failures are logged, not raised,
+    since the data is already committed.
 
-async def get_db() -> AsyncSession:
-    """Dependency to get database session."""
+    Args:
+        session: Database session from ``get_db``
+        callback: Coroutine function to await after the commit
+    """
+    session.info.setdefault("after_commit", []).append(callback)
+
+
+async def _run_after_commit(session: AsyncSession) -> None:
+    for callback in session.info.pop("after_commit", []):
+        try:
+            await callback()
+        except Exception:
+            logger.exception("After-commit callback failed")
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit(session: Session) -> None:
+    """Rolled back writes must not trigger their side effects."""
+    session.info.pop("after_commit", None)
+
+
+def _requester_key(request: Request) -> str:
+    """Identify the caller: its bearer token if any, else its address."""
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return hashlib.sha256(authorization.encode()).hexdigest()
+    return request.client.host if request.client else "anonymous"
+
+
+async def _mark_write(key: str) -> None:
+    """Pin a requester's reads to the primary for the read-your-writes window."""
+    _recent_writers.set(key, True)
+    if redis_client.redis:
+        try:
+            await cache_set(
+                f"recent-write:{key}", 1, ttl=settings.DATABASE_READ_YOUR_WRITES_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"Recent write marker failed: {e}")
+
+
+async def _wrote_recently(key: str) -> bool:
+    """Whether a requester wrote within the read-your-writes window."""
+    if _recent_writers.get(key):
+        return True
+    if redis_client.redis:
+        try:
+            return await cache_get(f"recent-write:{key}") is not None
+        except Exception as e:
+            logger.warning(f"Recent write lookup failed: {e}")
+    return False
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get database session.
+
+    The session checks out a connection on its first statement and only
+    commits if it wrote something; otherwise closing it ends the transaction.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            if _has_writes(session):
+                await session.commit()
+                await _run_after_commit(session)
+                if read_session_factories:
+                    await _mark_write(_requester_key(request))
         except Exception:
             await session.rollback()
             raise
@@ -43,55 +441,240 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
-async def init_db() -> None:
-    """Initialize database (create tables and admin user)."""
-    # Import models here to avoid circular import
+async def _replica_index(request: Request) -> Optional[int]:
+    """Pick a read replica, or None to read from the primary."""
+    if read_session_factories and not await _wrote_recently(_requester_key(request)):
+        return next(_read_counter) % len(read_session_factories)
+    return None
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get a database session for read-only endpoints.
+
+    Statements run in autocommit mode, without BEGIN/COMMIT round trips.
+    Uses the read replicas round-robin when DATABASE_READ_URLS is set,
+    except for requesters that wrote within the read-your-writes window,
+    who keep reading from the primary.
+    """
+    index = await _replica_index(request)
+    session_factory = (
+        AsyncReadSessionLocal if index is None else read_session_factories[index]
+    )
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+async def get_snapshot_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get a session running in one read-only snapshot.
+
+    Like get_read_db, for read-only endpoints whose statements must all see
+    the same data (e.g. a page and its total).
+    """
+    index = await _replica_index(request)
+    session_factory = (
+        AsyncSnapshotSessionLocal
+        if index is None
+        else snapshot_session_factories[index]
+    )
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+# Advisory lock key serializing schema setup and the startup bootstrap
+# across workers ("novainit" as a 64-bit integer)
+_INIT_LOCK_KEY = 0x6E6F7661696E6974
+
+_MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+
+@lru_cache
+def _schema_revisions() -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Head revisions and all known revisions of the Alembic migrations."""
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory(str(_MIGRATIONS_DIR))
+    return (
+        frozenset(script.get_heads()),
+        frozenset(revision.revision for revision in script.walk_revisions()),
+    )
+
+
+async def _schema_state(conn: AsyncConnection) -> Tuple[Set[str], List[str]]:
+    """
+    Revisions stamped in the database and the model tables it lacks.
+
+    One catalog query however many tables there are, unlike create_all,
+    which reflects each table and type in turn.
+    """
+    result = await conn.execute(
+        text(
+            "SELECT to_regclass('alembic_version') IS NOT NULL, "
+            "ARRAY(SELECT name FROM unnest(CAST(:tables AS text[])) AS name "
+            "WHERE to_regclass(name) IS NULL)"
+        ),
+        {"tables": list(Base.metadata.tables)},
+    )
+    stamped, missing = result.one()
+    revisions = set()
+    if stamped:
+        result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        revisions = set(result.scalars().all())
+    return revisions, missing
+
+
+async def _stamp(conn: AsyncConnection, revisions: Iterable[str]) -> None:
+    """Record revisions in alembic_version, as ``alembic stamp`` would."""
+    await conn.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS alembic_version ("
+            "version_num VARCHAR(32) NOT NULL, "
+            "CONSTRAINT alembic_version_pkc PRIMARY KEY (version_num))"
+        )
+    )
+    for revision in revisions:
+        await conn.execute(
+            text(
+                "INSERT INTO alembic_version (version_num) VALUES (:revision) "
+                "ON CONFLICT DO NOTHING"
+            ),
+            {"revision": revision},
+        )
+
+
+async def _create_admin(conn: AsyncConnection) -> None:
+    """Create the admin user from the ADMIN_* settings, if they are set."""
+    if not (
+        settings.ADMIN_EMAIL and settings.ADMIN_USERNAME and settings.ADMIN_PASSWORD
+    ):
+        return
+
+    # Import here to avoid circular import
+    from app.core.security import get_password_hash_async
     from app.db.models.user import User, UserRole
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    # Create admin user if credentials are provided
-    if settings.ADMIN_EMAIL and settings.ADMIN_USERNAME and settings.ADMIN_PASSWORD:
-        # Import here to avoid circular import
-        from app.core.security import get_password_hash
-
-        async with AsyncSessionLocal() as session:
-            try:
-                # Check if admin user already exists
-                result = await session.execute(
-                    select(User).where(
-                        (User.email == settings.ADMIN_EMAIL)
-                        | (User.username == settings.ADMIN_USERNAME)
-                        | (User.role == UserRole.ADMIN)
-                    )
+    # A savepoint, so a failure here keeps the rest of the bootstrap
+    async with AsyncSessionLocal(
+        bind=conn, join_transaction_mode="create_savepoint"
+    ) as session:
+        try:
+            # Check if admin user already exists
+            result = await session.execute(
+                select(User).where(
+                    (User.email == settings.ADMIN_EMAIL)
+                    | (User.username == settings.ADMIN_USERNAME)
+                    | (User.role == UserRole.ADMIN)
+                )
+            )
+            existing_admin = result.scalar_one_or_none()
+
+            if not existing_admin:
+                # Create admin user
+                admin_user = User(
+                    email=settings.ADMIN_EMAIL,
+                    username=settings.ADMIN_USERNAME,
+                    password_hash=await get_password_hash_async(
+                        settings.ADMIN_PASSWORD
+                    ),
+                    full_name=settings.ADMIN_FULL_NAME,
+                    role=UserRole.ADMIN,
+                    is_active=True,
+                    is_admin=True,
                 )
-                existing_admin = result.scalar_one_or_none()
-
-                if not existing_admin:
-                    # Create admin user
-                    admin_user = User(
-                        email=settings.ADMIN_EMAIL,
-                        username=settings.ADMIN_USERNAME,
-                        password_hash=get_password_hash(settings.ADMIN_PASSWORD),
-                        full_name=settings.ADMIN_FULL_NAME,
-                        role=UserRole.ADMIN,
-                        is_active=True,
-                        is_admin=True,
-                    )
 
-                    session.add(admin_user)
+                session.add(admin_user)
+                await session.commit()
+                logger.info(f"Admin user created: {settings.ADMIN_USERNAME}")
+            else:
+                # Update existing admin if needed
+                if existing_admin.role != UserRole.ADMIN:
+                    existing_admin.role = UserRole.ADMIN
+                    existing_admin.is_admin = True
                     await session.commit()
-                    logger.info(f"Admin user created: {settings.ADMIN_USERNAME}")
-                else:
-                    # Update existing admin if needed
-                    if existing_admin.role != UserRole.ADMIN:
-                        existing_admin.role = UserRole.ADMIN
-                        existing_admin.is_admin = True
-                        await session.commit()
-                        logger.info(
-                            f"Existing user promoted to admin: {existing_admin.username}"
-                        )
-            except Exception as e:
-                logger.error(f"Error creating admin user: {e}")
-                await session.rollback()
+                    logger.info(
+                        f"Existing user promoted to admin: {existing_admin.username}"
+                    )
+        except Exception as e:
+            logger.error(f"Error creating admin user: {e}")
+            await session.rollback()
+
+
+async def init_db(bind: Optional[AsyncEngine] = None) -> None:
+    """
+    Check the database schema and run the startup bootstrap.
+
+    Every worker runs this at startup, so the schema is not reflected: the
+    Alembic revision and the model tables are checked in one catalog query.
+    Creating missing tables, the job posting partitions and the admin user
+    then runs under a transaction-level advisory lock (safe behind
+    PgBouncer). Workers that find the lock taken skip the bootstrap rather
+    than wait, except while the tables themselves are being created.
+
+    Args:
+        bind: Engine to initialize (the application engine by default)
+
+    Raises:
+        RuntimeError: If the database schema is behind the migrations
+    """
+    # Import here to avoid circular import
+    from app.db import models  # noqa: F401  (register models on Base)
+    from app.db.partitions import create_partitions, upcoming_months
+
+    started = time.perf_counter()
+    heads, known = _schema_revisions()
+
+    async with (bind or engine).begin() as conn:
+        revisions, missing = await _schema_state(conn)
+        if revisions - known:
+            # Migrated by a newer release during a rolling deploy
+            logger.warning(
+                f"Database schema revision {', '.join(sorted(revisions))} "
+                "is newer than this release"
+            )
+        elif revisions and revisions != heads:
+            raise RuntimeError(
+                f"Database schema is at revision {', '.join(sorted(revisions))}, "
+                f"expected {', '.join(sorted(heads))}: run `alembic upgrade head`"
+            )
+        elif not revisions and len(missing) < len(Base.metadata.tables):
+            raise RuntimeError(
+                "Database schema is not under Alembic control: "
+                "run `alembic stamp head` once it matches the models"
+            )
+
+        if missing:
+            # A new database, or tables no migration creates: every worker
+            # waits here, then create_all finds what the first one created
+            await conn.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": _INIT_LOCK_KEY}
+            )
+            await conn.run_sync(Base.metadata.create_all)
+            if not revisions:
+                await _stamp(conn, heads)
+            bootstrap = True
+        else:
+            bootstrap = await conn.scalar(
+                text("SELECT pg_try_advisory_xact_lock(:key)"),
+                {"key": _INIT_LOCK_KEY},
+            )
+
+        if bootstrap:
+            # Postings for a month without a partition land in the default
+            # one and then block creating it, so don't rely on the
+            # maintenance job
+            await conn.run_sync(
+                create_partitions,
+                upcoming_months(settings.JOB_POSTING_PARTITIONS_AHEAD),
+            )
+            await _create_admin(conn)
+        else:
+            logger.info("Database bootstrap running in another worker, skipped")
+
+    logger.info(f"Database ready in {(time.perf_counter() - started) * 1000:.0f}ms")
@@ -0,0 +1,143 @@
+"""
+Request-scoped batching of primary key lookups.
+
+Lookups by id made in the same event loop tick (e.g. from ``asyncio.gather``)
+are resolved together with one ``WHERE id = ANY(:ids)`` query per model, and
+every result, including misses, is cached for the rest of the session. The
+loader lives in ``session.info``, so it shares the session's lifetime: one
+request for sessions from ``get_db`` and ``get_read_db``.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+_LOADER_KEY = "identity_loader"
+
+# Fetches the instances of a batch of ids, in any order, skipping misses
+Fetch = Callable[[list[UUID]], Awaitable[Sequence[Any]]]
+
+
+def _as_uuid(id: UUID | str) -> UUID:
+    """Cache keys are UUIDs, as on loaded instances; callers may pass strings."""
+    return id if isinstance(id, UUID) else UUID(str(id))
+
+
+class IdentityLoader:
+    """Batches and caches lookups by id for one session."""
+
+    def __init__(self):
+        self._cache: dict[tuple[type, UUID], Any] = {}
+        self._pending: dict[type, dict[UUID, asyncio.Future]] = {}
+        self._fetchers: dict[type, Fetch] = {}
+        self._scheduled: Optional[asyncio.Handle] = None
+        self._tasks: set[asyncio.Task] = set()
+        # The session runs one statement at a time
+        self._lock = asyncio.Lock()
+
+    async def load(self, model: type, id: UUID | str, fetch: Fetch) -> Optional[Any]:
+        """
+        Load one instance, batched with the other lookups of this tick.
+
+        Args:
+            model: Model class of the instance
+            id: Primary key to look up
+            fetch: Query for a batch of the model's ids
+
+        Returns:
+            Model instance or None
+        """
+        (instance,) = await self.load_many(model, [id], fetch)
+        return instance
+
+    async def load_many(
+        self, model: type, ids: Sequence[UUID | str], fetch: Fetch
+    ) -> list[Optional[Any]]:
+        """
+        Load several instances, batched with the other lookups of this tick.
+
+        Args:
+            model: Model class of the instances
+            ids: Primary keys to look up
+            fetch: Query for a batch of the model's ids
+
+        Returns:
+            Model instance or None for each id, in order
+        """
+        loop = asyncio.get_running_loop()
+        futures = []
+        for id in map(_as_uuid, ids):
+            future = loop.create_future()
+            if (model, id) in self._cache:
+                future.set_result(self._cache[model, id])
+            else:
+                pending = self._pending.setdefault(model, {})
+                future = pending.setdefault(id, future)
+                self._fetchers[model] = fetch
+            futures.append(future)
+
+        if self._pending and self._scheduled is None:
+            self._scheduled = loop.call_soon(self._dispatch)
+        # Other callers may wait on the same futures: a cancelled caller
+        # must not cancel them
+        return list(await asyncio.shield(asyncio.gather(*futures)))
+
+    def prime(self, model: type, id: UUID | str, instance: Optional[Any]) -> None:
+        """Cache what a lookup of id would return, e.g. after a write."""
+        self._cache[model, _as_uuid(id)] = instance
+
+    def clear(self) -> None:
+        """Forget every cached result."""
+        self._cache.clear()
+
+    def _dispatch(self) -> None:
+        self._scheduled = None
+        pending, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._resolve(pending))
+        # Keep a reference until done, the event loop only holds weak ones
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, pending: dict[type, dict[UUID, asyncio.Future]]) -> None:
+        try:
+            async with self._lock:
+                for model, futures in pending.items():
+                    try:
+                        instances = await self._fetchers[model](list(futures))
+                    except Exception as e:
+                        for future in futures.values():
+                            if not future.done():
+                                future.set_exception(e)
+                        continue
+
+                    found = {instance.id: instance for instance in instances}
+                    for id, future in futures.items():
+                        self._cache[model, id] = found.get(id)
+                        if not future.done():
+                            future.set_result(found.get(id))
+        finally:
+            # Cancelled midway: don't leave the remaining waiters hanging
+            for futures in pending.values():
+                for future in futures.values():
+                    if not future.done():
+                        future.cancel()
+
+
+def get_loader(session: AsyncSession) -> IdentityLoader:
+    """The identity loader of a session, created on first use."""
+    loader = session.info.get(_LOADER_KEY)
+    if loader is None:
+        loader = session.info[_LOADER_KEY] = IdentityLoader()
+    return loader
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_after_rollback(session: Session) -> None:
+    """Rolled back rows may no longer exist, so forget them."""
+    loader = session.info.get(_LOADER_KEY)
+    if loader is not None:
+        loader.clear()
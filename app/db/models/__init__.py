@@ -1,7 +1,15 @@
 """Database models."""
 
 from app.db.models.user import User, UserRole
-from app.db.models.job import JobPosting, PlatformEnum
+from app.db.models.job import JobPosting, JobPostingKey, PlatformEnum
 from app.db.models.application import Application, ApplicationStatus
 
-__all__ = ["User", "UserRole", "JobPosting", "PlatformEnum", "Application", "ApplicationStatus"]
+__all__ = [
+    "User",
+    "UserRole",
+    "JobPosting",
+    "JobPostingKey",
+    "PlatformEnum",
+    "Application",
+    "ApplicationStatus",
+]
@@ -1,8 +1,10 @@
 import enum
 import uuid
+from typing import Optional
 
 from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Numeric, Text, Enum
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, query_expression, relationship
 from sqlalchemy.sql import func
 from app.db.database import Base
 
@@ -26,11 +28,10 @@ class Application(Base):
         PG_UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     job_posting_id = Column(
         PG_UUID(as_uuid=True),
-        ForeignKey("job_postings.id", ondelete="CASCADE"),
+        ForeignKey("job_posting_keys.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
@@ -53,7 +54,29 @@ class Application(Base):
     )
     submitted_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Filled by queries that select it (see ApplicationRepository)
+    proposal_preview: Mapped[Optional[str]] = query_expression()
+
+    # The foreign key points at the URL registry (job_posting_keys), so the
+    # join is spelled out. Never loaded lazily: unless a query eager-loads
+    # it (include=job) it reads as None, as it does for archived postings.
+    job = relationship(
+        "JobPosting",
+        primaryjoin="foreign(Application.job_posting_id) == JobPosting.id",
+        viewonly=True,
+        lazy="noload",
+    )
+
     __table_args__ = (
-        Index("idx_applications_status", "status"),
-        Index("idx_applications_user_status", "user_id", "status"),
+        # Listings filter on user_id (and optionally status) and page over
+        # (created_at, id) in either direction, so these also cover the sort
+        Index("idx_applications_user_created_at_id", "user_id", "created_at", "id"),
+        Index(
+            "idx_applications_user_status_created_at_id",
+            "user_id",
+            "status",
+            "created_at",
+            "id",
+        ),
     )
+    __mapper_args__ = {"eager_defaults": True}
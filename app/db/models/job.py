@@ -1,13 +1,30 @@
 """JOB LISTING MODEL"""
 
 import enum
+import hashlib
+import json
 import uuid
+from decimal import Decimal
+from typing import Any, Optional
 
-from sqlalchemy import DECIMAL, JSON, Column, DateTime, Enum, Index, String, Text
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy import (
+    DECIMAL,
+    Column,
+    Computed,
+    DateTime,
+    Enum,
+    Index,
+    String,
+    Text,
+    event,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID as PG_UUID
 from sqlalchemy.sql import func
 
+from app.core.config import settings
 from app.db.database import Base
+from app.db.partitions import create_partitions, upcoming_months
+from app.db.types import SkillList, normalize_skills
 
 
 class PlatformEnum(str, enum.Enum):
@@ -17,8 +34,97 @@ class PlatformEnum(str, enum.Enum):
     freelancer = "freelancer"
 
 
+# Text search configuration for JobPosting.search_vector and its queries
+SEARCH_CONFIG = "english"
+
+# Title matches rank above description matches
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', job_title), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', description), 'B')"
+)
+
+# Columns covered by JobPosting.content_hash
+CONTENT_HASH_FIELDS = (
+    "job_title",
+    "description",
+    "budget",
+    "required_skills",
+    "platform",
+)
+
+
+def content_fingerprint(
+    job_title: str,
+    description: str,
+    budget: Optional[Any],
+    required_skills: list,
+    platform: PlatformEnum | str,
+) -> str:
+    """SHA-256 over the columns that make up a job posting's content."""
+    if budget is not None:
+        budget = format(Decimal(str(budget)).normalize(), "f")
+    content = json.dumps(
+        [
+            job_title,
+            description,
+            budget,
+            sorted(normalize_skills(required_skills) or []),
+            PlatformEnum(platform).value,
+        ],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+# Keeps job_posting_keys in step with every write to job_postings, however
+# it is made; a second posting with a known URL fails on the keys' unique
+# constraint. Detaching or dropping a partition fires no row triggers.
+SYNC_KEYS_FUNCTION = """
+CREATE OR REPLACE FUNCTION job_posting_keys_sync() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO job_posting_keys (id, url) VALUES (NEW.id, NEW.url)
+        ON CONFLICT (id) DO NOTHING;
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE job_posting_keys SET url = NEW.url WHERE id = NEW.id;
+    ELSE
+        DELETE FROM job_posting_keys WHERE id = OLD.id;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+SYNC_KEYS_TRIGGERS = [
+    "CREATE TRIGGER job_posting_keys_insert AFTER INSERT ON job_postings "
+    "FOR EACH ROW EXECUTE FUNCTION job_posting_keys_sync()",
+    "CREATE TRIGGER job_posting_keys_update AFTER UPDATE OF url ON job_postings "
+    "FOR EACH ROW WHEN (OLD.url IS DISTINCT FROM NEW.url) "
+    "EXECUTE FUNCTION job_posting_keys_sync()",
+    "CREATE TRIGGER job_posting_keys_delete AFTER DELETE ON job_postings "
+    "FOR EACH ROW EXECUTE FUNCTION job_posting_keys_sync()",
+]
+
+
+class JobPostingKey(Base):
+    """
+    Identity of a job posting: its id and its globally unique URL.
+
+    job_postings is partitioned by created_at, and Postgres only enforces
+    uniqueness within a partition, so URL dedup (and the applications
+    foreign key) rely on this small unpartitioned table instead. Rows are
+    written by triggers on job_postings or claimed ahead of an upsert.
+    """
+
+    __tablename__ = "job_posting_keys"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, nullable=False)
+    url = Column(String, nullable=False, unique=True)
+
+
 class JobPosting(Base):
-    """Model for job postings"""
+    """Model for job postings (range-partitioned by month, see app.db.partitions)"""
 
     __tablename__ = "job_postings"
 
@@ -29,13 +135,53 @@ class JobPosting(Base):
     job_title = Column(String, nullable=False)
     description = Column(Text, nullable=False)
     budget = Column(DECIMAL, nullable=True)
-    required_skills = Column(JSON, nullable=False)
-    url = Column(String, nullable=False, unique=True)
+    required_skills = Column(SkillList, nullable=False)
+    url = Column(String, nullable=False)
+    content_hash = Column(String(64), nullable=True)
+    # Table column only (see exclude_properties): it is generated by Postgres
+    # and only read by full-text search, via JobPosting.__table__.c
+    search_vector = Column(
+        TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True)
+    )
+    # The partition key has to be part of the primary key
     created_at = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        primary_key=True,
     )
     __table_args__ = (
-        Index("idx_job_title", "job_title"),
-        Index("idx_platform", "platform"),
-        Index("idx_created_at", "created_at"),
+        Index("idx_job_postings_url", "url"),
+        Index("idx_job_postings_created_at_id", "created_at", "id"),
+        Index(
+            "idx_job_postings_platform_created_at_id", "platform", "created_at", "id"
+        ),
+        Index("idx_job_postings_budget", "budget"),
+        Index(
+            "idx_job_postings_required_skills",
+            "required_skills",
+            postgresql_using="gin",
+        ),
+        Index(
+            "idx_job_postings_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
+    __mapper_args__ = {
+        "eager_defaults": True,
+        "exclude_properties": ["search_vector"],
+        # ids are unique on their own (job_posting_keys), so rows are
+        # identified without their partition key
+        "primary_key": [id],
+    }
+
+
+@event.listens_for(JobPosting.__table__, "after_create")
+def _create_partitions_and_triggers(target, connection, **kw):
+    """Set up key syncing and the first partitions for a new job_postings."""
+    connection.exec_driver_sql(SYNC_KEYS_FUNCTION)
+    for trigger in SYNC_KEYS_TRIGGERS:
+        connection.exec_driver_sql(trigger)
+    create_partitions(connection, upcoming_months(settings.JOB_POSTING_PARTITIONS_AHEAD))
@@ -3,11 +3,21 @@
 import enum
 import uuid
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, Numeric, String, TypeDecorator
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Numeric,
+    String,
+    TypeDecorator,
+)
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.sql import func
 
 from app.db.database import Base
+from app.db.types import SkillList
 
 
 class UserRole(str, enum.Enum):
@@ -66,7 +76,7 @@ class User(Base):
     is_active = Column(Boolean, default=True, nullable=False)
     is_admin = Column(Boolean, default=False, nullable=False)
     role = Column(UserRoleEnum(), default=UserRole.USER, nullable=False)
-    skills = Column(JSON, server_default="[]", nullable=False)
+    skills = Column(SkillList, server_default="[]", nullable=False)
     experience_summary = Column(String, nullable=True)
     portfolio_links = Column(JSON, server_default="[]", nullable=False)
     preferred_rate = Column(Numeric(10, 2), nullable=True)
@@ -79,3 +89,10 @@ class User(Base):
         onupdate=func.now(),
         nullable=False,
     )
+
+    __table_args__ = (
+        Index("idx_users_created_at_id", "created_at", "id"),
+        Index("idx_users_role_created_at_id", "role", "created_at", "id"),
+        Index("idx_users_skills", "skills", postgresql_using="gin"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
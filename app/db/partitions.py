@@ -0,0 +1,296 @@
+"""
+Monthly range partitions of job_postings.
+
+job_postings is partitioned by created_at into one partition per calendar
+month (UTC), named job_postings_yYYYYmMM, plus a default partition that
+catches rows outside every monthly range (e.g. backfills). New postings
+land in the current month, so its indexes stay small and hot, and vacuum
+works through one month at a time instead of the whole history.
+
+``maintain_partitions`` keeps the coming months' partitions ready and
+archives months older than the retention period: their rows are exported
+to a gzipped CSV file, then the partition is detached and dropped. Run it
+daily, e.g. from cron:
+
+    python -m app.db.partitions [--detach-only]
+"""
+
+import argparse
+import asyncio
+import gzip
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLE = "job_postings"
+DEFAULT_PARTITION = f"{PARTITIONED_TABLE}_default"
+
+_PARTITION_NAME = re.compile(rf"^{PARTITIONED_TABLE}_y(\d{{4}})m(\d{{2}})$")
+
+
+@dataclass
+class PartitionMaintenance:
+    """Partitions touched by a maintenance run."""
+
+    created: list[str] = field(default_factory=list)
+    archived: list[Path] = field(default_factory=list)
+    detached: list[str] = field(default_factory=list)
+
+
+def month_start(value: date) -> date:
+    """First day of value's month."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month ``months`` after (or before) month."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the partition holding month's rows."""
+    return f"{PARTITIONED_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def upcoming_months(ahead: int, today: Optional[date] = None) -> list[date]:
+    """The current month and the ``ahead`` months after it."""
+    current = month_start(today or datetime.now(timezone.utc).date())
+    return [add_months(current, i) for i in range(ahead + 1)]
+
+
+def list_partitions(connection: Connection) -> list[str]:
+    """Names of the partitions currently attached to job_postings."""
+    result = connection.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = CAST(:table AS regclass)"
+        ),
+        {"table": PARTITIONED_TABLE},
+    )
+    return sorted(result.scalars().all())
+
+
+def create_partitions(connection: Connection, months: Iterable[date]) -> list[str]:
+    """
+    Create the default partition and the given months' partitions.
+
+    Args:
+        connection: Connection to run the DDL on
+        months: First days of the months to create
+
+    Returns:
+        Names of the partitions that did not exist yet
+    """
+    existing = set(list_partitions(connection))
+    created = []
+
+    if DEFAULT_PARTITION not in existing:
+        connection.execute(
+            text(
+                f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PARTITIONED_TABLE} DEFAULT"
+            )
+        )
+        created.append(DEFAULT_PARTITION)
+
+    for month in months:
+        name = partition_name(month)
+        if name in existing:
+            continue
+        # Bounds are UTC midnights, whatever the session time zone
+        start, end = (
+            datetime.combine(bound, time(), tzinfo=timezone.utc)
+            for bound in (month, add_months(month, 1))
+        )
+        stranded = connection.execute(
+            text(
+                f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} "
+                "WHERE created_at >= :start AND created_at < :end)"
+            ),
+            {"start": start, "end": end},
+        )
+        if stranded.scalar_one():
+            # Postgres refuses to create it; the month stays in the default
+            logger.warning("Skipping partition %s: rows in %s", name, DEFAULT_PARTITION)
+            continue
+        connection.execute(
+            text(
+                f"CREATE TABLE {name} PARTITION OF {PARTITIONED_TABLE} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        )
+        created.append(name)
+    return created
+
+
+def expired_partitions(partitions: Iterable[str], cutoff: date) -> list[str]:
+    """Monthly partitions whose whole range lies before cutoff."""
+    expired = []
+    for name in partitions:
+        match = _PARTITION_NAME.match(name)
+        if match and date(int(match[1]), int(match[2]), 1) < cutoff:
+            expired.append(name)
+    return expired
+
+
+async def archive_partition(
+    connection: AsyncConnection, name: str, archive_dir: Path
+) -> Path:
+    """
+    Export a partition's rows to ``<archive_dir>/<name>.csv.gz``.
+
+    The partition is locked against writes until the caller's transaction
+    ends, so nothing written after the export is lost when it is dropped.
+
+    Args:
+        connection: Connection inside the transaction that drops the partition
+        name: Partition to export
+        archive_dir: Directory for the archive file
+
+    Returns:
+        Path of the archive file
+    """
+    # Import here to avoid circular import
+    from app.db.models.job import JobPosting
+
+    # Generated columns (the search vector) are rebuilt on restore
+    columns = [
+        column.name
+        for column in JobPosting.__table__.columns
+        if column.computed is None
+    ]
+
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    path = archive_dir / f"{name}.csv.gz"
+    partial = path.with_name(f"{path.name}.partial")
+
+    await connection.execute(text(f"LOCK TABLE {name} IN SHARE MODE"))
+    raw = await connection.get_raw_connection()
+    driver_connection = raw.driver_connection
+    if driver_connection is None:
+        raise RuntimeError(f"Connection to archive {name} was invalidated")
+    with gzip.open(partial, "wb") as archive:
+
+        async def write(chunk: bytes) -> None:
+            archive.write(chunk)
+
+        await driver_connection.copy_from_table(
+            name, columns=columns, output=write, format="csv", header=True
+        )
+    partial.replace(path)
+    return path
+
+
+async def maintain_partitions(
+    engine: Optional[AsyncEngine] = None,
+    *,
+    today: Optional[date] = None,
+    ahead: Optional[int] = None,
+    retention_months: Optional[int] = None,
+    archive_dir: Optional[Path] = None,
+    detach_only: bool = False,
+) -> PartitionMaintenance:
+    """
+    Create upcoming partitions and archive (or detach) expired ones.
+
+    Each expired partition is handled in its own transaction: export, detach,
+    drop the URL keys of its postings that nobody applied to, then drop it.
+    Keys referenced by applications are kept, so those applications stay
+    valid and re-ingesting such a URL restores the posting under its old id.
+
+    Args:
+        engine: Engine to run on (the application engine by default)
+        today: Reference date (UTC today by default)
+        ahead: Future months to create (JOB_POSTING_PARTITIONS_AHEAD)
+        retention_months: Months kept attached before the current one
+            (JOB_POSTING_RETENTION_MONTHS)
+        archive_dir: Directory for archive files (JOB_POSTING_ARCHIVE_DIR)
+        detach_only: Detach expired partitions and keep them as standalone
+            tables instead of exporting and dropping them
+
+    Returns:
+        Partitions created, archived and detached
+    """
+    if engine is None:
+        from app.db.database import engine as app_engine
+
+        engine = app_engine
+    today = today or datetime.now(timezone.utc).date()
+    ahead = settings.JOB_POSTING_PARTITIONS_AHEAD if ahead is None else ahead
+    if retention_months is None:
+        retention_months = settings.JOB_POSTING_RETENTION_MONTHS
+    archive_path = Path(archive_dir or settings.JOB_POSTING_ARCHIVE_DIR)
+
+    result = PartitionMaintenance()
+    async with engine.begin() as connection:
+        result.created = await connection.run_sync(
+            create_partitions, upcoming_months(ahead, today)
+        )
+        partitions = await connection.run_sync(list_partitions)
+
+    cutoff = add_months(month_start(today), -retention_months)
+    for name in expired_partitions(partitions, cutoff):
+        async with engine.begin() as connection:
+            if not detach_only:
+                path = await archive_partition(connection, name, archive_path)
+            await connection.execute(
+                text(f"ALTER TABLE {PARTITIONED_TABLE} DETACH PARTITION {name}")
+            )
+            if detach_only:
+                result.detached.append(name)
+                continue
+            await connection.execute(
+                text(
+                    f"DELETE FROM job_posting_keys USING {name} "
+                    f"WHERE job_posting_keys.id = {name}.id "
+                    "AND NOT EXISTS (SELECT 1 FROM applications "
+                    "WHERE applications.job_posting_id = job_posting_keys.id)"
+                )
+            )
+            await connection.execute(text(f"DROP TABLE {name}"))
+            result.archived.append(path)
+
+    for name in result.created:
+        logger.info("Created partition %s", name)
+    for path in result.archived:
+        logger.info("Archived partition to %s", path)
+    for name in result.detached:
+        logger.info("Detached partition %s", name)
+    return result
+
+
+async def main(argv: Optional[list[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--detach-only",
+        action="store_true",
+        help="detach expired partitions instead of archiving and dropping them",
+    )
+    args = parser.parse_args(argv)
+
+    from app.db.database import engine
+
+    try:
+        result = await maintain_partitions(engine, detach_only=args.detach_only)
+    finally:
+        await engine.dispose()
+    print(f"created: {', '.join(result.created) or '-'}")
+    print(f"archived: {', '.join(map(str, result.archived)) or '-'}")
+    print(f"detached: {', '.join(result.detached) or '-'}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,18 +1,26 @@
 """Application repository for applications specific"""
 
-from typing import Literal, Optional
+from typing import Literal, Optional, Type
 from uuid import UUID
 
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from sqlalchemy.sql import select
 
 from app.db.models.application import Application, ApplicationStatus
-from app.db.repositories.base import BaseRepository
+from app.db.repositories.base import BaseRepository, SchemaType
+from app.db.repositories.job_repository import JobPostingRepository
+from app.utils.preview import preview_column
 
 
 class ApplicationRepository(BaseRepository[Application]):
     """Application repository"""
 
+    computed_columns = {
+        "proposal_preview": preview_column(Application.proposal_content),
+    }
+
     def __init__(self, session: AsyncSession):
         """Initialize application repository."""
         super().__init__(Application, session)
@@ -24,24 +32,42 @@ class ApplicationRepository(BaseRepository[Application]):
         limit: int = 20,
         status: Optional[ApplicationStatus] = None,
         sort: Literal["asc", "desc"] = "desc",
-    ) -> list[Application]:
-        """Get applications by user id."""
+        cursor: Optional[str] = None,
+        schema: Optional[Type[SchemaType]] = None,
+        job_schema: Optional[Type[BaseModel]] = None,
+    ) -> list[Application] | list[SchemaType]:
+        """Get applications by user id, projected onto schema if given.
+
+        With job_schema, each application's ``job`` is joined in the same
+        query, limited to the columns job_schema reads.
+        """
 
-        query = select(Application).where(Application.user_id == user_id)
+        if job_schema is None:
+            query = self._select(schema)
+        else:
+            jobs = JobPostingRepository(self.session)
+            query = (
+                select(Application)
+                .options(
+                    *(self._load_only(schema) if schema else []),
+                    joinedload(Application.job).options(*jobs._load_only(job_schema)),
+                )
+                .execution_options(populate_existing=True)
+            )
+        query = query.where(Application.user_id == user_id)
 
         if status is not None:
             query = query.where(Application.status == status)
 
-        order_by = (
-            Application.created_at.asc()
-            if sort == "asc"
-            else Application.created_at.desc()
-        )
+        query = self._paginate(query, skip, limit, cursor, sort)
+        if job_schema is None:
+            return await self._fetch(query, schema)
 
-        result = await self.session.execute(
-            query.order_by(order_by).offset(skip).limit(limit)
-        )
-        return list(result.scalars().all())
+        result = await self.session.execute(query)
+        applications = list(result.scalars().all())
+        if schema is None:
+            return applications
+        return [schema.model_validate(application) for application in applications]
 
     async def get_by_application_id(
         self, user_id: UUID, application_id: UUID
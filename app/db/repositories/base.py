@@ -1,20 +1,90 @@
 """Base repository with generic CRUD operations."""
 
-from typing import Generic, List, Optional, Type, TypeVar
+import json
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 from uuid import UUID
 
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import (
+    ColumnDefault,
+    Select,
+    any_,
+    bindparam,
+    delete,
+    func,
+    inspect,
+    literal,
+    literal_column,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, with_expression
 
 # from sqlalchemy.orm import selectinload
+from app.core.config import settings
 from app.db.database import Base
+from app.db.loader import get_loader
+from app.utils.cache import TTLCache
+from app.utils.pagination import decode_cursor
 
 ModelType = TypeVar("ModelType", bound=Base)
+SchemaType = TypeVar("SchemaType", bound=BaseModel)
+
+# Postgres caps a statement at 32767 bind parameters
+MAX_BIND_PARAMS = 32767
+
+# Exact counts shared by count(mode="cached"), keyed by table and filters
+_count_cache = TTLCache(maxsize=1024, ttl=settings.COUNT_CACHE_TTL)
+
+
+def _plan_rows(node: dict[str, Any], reltuples: dict[str, float]) -> float:
+    """
+    Row estimate of an EXPLAIN (FORMAT JSON) plan node.
+
+    The planner assumes at least one row per scan, so scans of tables known
+    to be empty (e.g. upcoming partitions) count as zero.
+    """
+    if node["Node Type"] in ("Append", "Merge Append"):
+        return sum(_plan_rows(child, reltuples) for child in node.get("Plans", []))
+    if reltuples.get(node.get("Relation Name", "")) == 0:
+        return 0
+    return node["Plan Rows"]
+
+
+@dataclass
+class BulkWriteResult:
+    """Outcome of a bulk insert or upsert."""
+
+    ids: list[UUID] = field(default_factory=list)
+    inserted: int = 0
+    updated: int = 0
 
 
 class BaseRepository(Generic[ModelType]):
     """Base repository providing generic CRUD operations."""
 
+    # SQL expressions a projected schema may select by field name, in
+    # addition to the model's columns (e.g. previews of large text columns)
+    computed_columns: dict[str, Any] = {}
+
     def __init__(self, model: Type[ModelType], session: AsyncSession):
         """
         Initialize repository.
@@ -30,6 +100,9 @@ class BaseRepository(Generic[ModelType]):
         """
         Create a new record.
 
+        Server-generated columns come back in the INSERT's RETURNING clause
+        (models set ``eager_defaults``), so no refresh SELECT is needed.
+
         Args:
             **kwargs: Model attributes
 
@@ -39,126 +112,453 @@ class BaseRepository(Generic[ModelType]):
         instance = self.model(**kwargs)
         self.session.add(instance)
         await self.session.flush()
-        await self.session.refresh(instance)
+        get_loader(self.session).prime(self.model, instance.id, instance)
         return instance
 
+    def _chunks(
+        self, rows: list[dict[str, Any]], chunk_size: int
+    ) -> Iterable[list[dict[str, Any]]]:
+        """Split rows into chunks that fit the bind parameter limit."""
+        if not rows:
+            return
+        keys = rows[0].keys()
+        if any(row.keys() != keys for row in rows):
+            raise ValueError("All rows in a bulk write must have the same keys")
+
+        size = max(1, min(chunk_size, MAX_BIND_PARAMS // len(keys)))
+        for start in range(0, len(rows), size):
+            yield rows[start : start + size]
+
+    async def bulk_create(
+        self, rows: list[dict[str, Any]], chunk_size: int = 1000
+    ) -> BulkWriteResult:
+        """
+        Insert many records with multi-row INSERT statements.
+
+        Args:
+            rows: Column values per record (all rows need the same keys)
+            chunk_size: Maximum rows per statement
+
+        Returns:
+            Inserted ids and count
+        """
+        result = BulkWriteResult()
+        for chunk in self._chunks(rows, chunk_size):
+            inserted = await self.session.execute(
+                pg_insert(self.model).values(chunk).returning(self.model.id)
+            )
+            ids = list(inserted.scalars().all())
+            result.ids.extend(ids)
+            result.inserted += len(ids)
+        return result
+
+    async def bulk_upsert(
+        self,
+        rows: list[dict[str, Any]],
+        conflict_columns: list[str],
+        update_columns: Optional[list[str]] = None,
+        chunk_size: int = 1000,
+    ) -> BulkWriteResult:
+        """
+        Insert many records, updating those that hit a unique conflict.
+
+        Uses INSERT ... ON CONFLICT (conflict_columns) DO UPDATE, or DO
+        NOTHING when no update columns are given (skipped rows are not
+        reported). Rows repeating a conflict key are collapsed, last wins.
+
+        Args:
+            rows: Column values per record (all rows need the same keys)
+            conflict_columns: Columns of the unique constraint to upsert on
+            update_columns: Columns to overwrite on conflict
+            chunk_size: Maximum rows per statement
+
+        Returns:
+            Affected ids with inserted and updated counts
+        """
+        unique_rows = {
+            tuple(row[column] for column in conflict_columns): row for row in rows
+        }
+
+        result = BulkWriteResult()
+        for chunk in self._chunks(list(unique_rows.values()), chunk_size):
+            stmt = pg_insert(self.model).values(chunk)
+            if update_columns:
+                set_: dict[str, Any] = {
+                    column: stmt.excluded[column] for column in update_columns
+                }
+                for column in self.model.__table__.columns:
+                    onupdate = column.onupdate
+                    if isinstance(onupdate, ColumnDefault) and column.name not in set_:
+                        set_[column.name] = onupdate.arg
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=conflict_columns, set_=set_
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+
+            # xmax is 0 only for freshly inserted row versions
+            upserted: Result[Any] = await self.session.execute(
+                stmt.returning(
+                    self.model.id, literal_column("(xmax = 0)").label("inserted")
+                )
+            )
+            for id, inserted in upserted.all():
+                result.ids.append(id)
+                if inserted:
+                    result.inserted += 1
+                else:
+                    result.updated += 1
+        return result
+
+    async def _fetch_by_ids(self, ids: list[UUID]) -> List[ModelType]:
+        """Load records by ID with one ``WHERE id = ANY(:ids)`` query."""
+        # One array parameter, so the statement is the same for any number
+        # of ids and stays in the prepared statement cache
+        ids_param = bindparam("ids", ids, type_=postgresql.ARRAY(self.model.id.type))
+        result = await self.session.execute(
+            select(self.model).where(self.model.id == any_(ids_param))
+        )
+        return list(result.scalars().all())
+
     async def get_by_id(self, id: UUID) -> Optional[ModelType]:
         """
         Get a record by ID.
 
+        Lookups made in the same event loop tick (e.g. from asyncio.gather)
+        share one query, and results are cached for the session's request;
+        see ``app.db.loader``.
+
         Args:
             id: Record ID
 
         Returns:
             Model instance or None
         """
-        result = await self.session.execute(
-            select(self.model).where(self.model.id == id)
+        return await get_loader(self.session).load(self.model, id, self._fetch_by_ids)
+
+    async def get_many_by_ids(self, ids: Iterable[UUID]) -> List[ModelType]:
+        """
+        Get records by ID with a single query.
+
+        Args:
+            ids: Record IDs
+
+        Returns:
+            Model instances found, in the order of ids, without duplicates
+        """
+        ids = list(dict.fromkeys(ids))
+        instances = await get_loader(self.session).load_many(
+            self.model, ids, self._fetch_by_ids
         )
-        return result.scalar_one_or_none()
+        return [instance for instance in instances if instance is not None]
+
+    def _select(self, schema: Optional[Type[BaseModel]] = None) -> Select:
+        """
+        Select whole entities, or only the columns a response schema reads.
+
+        Args:
+            schema: Pydantic schema to project onto (None for entities)
+
+        Returns:
+            SELECT of the model or of the schema's columns
+        """
+        if schema is None:
+            return select(self.model)
+        fields = schema.model_fields
+        columns = [
+            getattr(self.model, key)
+            for key in inspect(self.model).column_attrs.keys()
+            if key in fields and key not in self.computed_columns
+        ]
+        columns.extend(
+            expression.label(key)
+            for key, expression in self.computed_columns.items()
+            if key in fields
+        )
+        return select(*columns)
+
+    def _load_only(self, schema: Type[BaseModel]) -> list:
+        """
+        Loader options limiting entities to the columns a schema reads.
+
+        The entity counterpart of ``_select``, for queries that need entities
+        (e.g. to eager-load relationships). Computed columns the schema reads
+        fill the model's ``query_expression()`` attributes of the same name.
+
+        Args:
+            schema: Pydantic schema the entities will be validated into
+
+        Returns:
+            Options for ``Select.options``, or a relationship loader's
+        """
+        fields = schema.model_fields
+        columns = [
+            getattr(self.model, key)
+            for key in inspect(self.model).column_attrs.keys()
+            if key in fields and key not in self.computed_columns
+        ]
+        options = [load_only(*columns)]
+        options.extend(
+            with_expression(getattr(self.model, key), expression)
+            for key, expression in self.computed_columns.items()
+            if key in fields
+        )
+        return options
+
+    @overload
+    async def _fetch(self, query: Select, schema: None = None) -> List[ModelType]: ...
+
+    @overload
+    async def _fetch(
+        self, query: Select, schema: Type[SchemaType]
+    ) -> List[SchemaType]: ...
+
+    @overload
+    async def _fetch(
+        self, query: Select, schema: Optional[Type[SchemaType]]
+    ) -> Union[List[ModelType], List[SchemaType]]: ...
+
+    async def _fetch(
+        self, query: Select, schema: Optional[Type[SchemaType]] = None
+    ) -> Union[List[ModelType], List[SchemaType]]:
+        """
+        Run a query built by ``_select`` and return its results.
+
+        Projected rows are validated straight into the schema, skipping ORM
+        entity construction and the identity map.
+
+        Args:
+            query: Query from ``_select``, with criteria applied
+            schema: Schema the query was projected onto (None for entities)
+
+        Returns:
+            Model instances, or schema instances when projected
+        """
+        result = await self.session.execute(query)
+        if schema is None:
+            return list(result.scalars().all())
+        return [schema.model_validate(row) for row in result]
+
+    def _paginate(
+        self,
+        query: Select,
+        skip: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort: Literal["asc", "desc"] = "desc",
+    ) -> Select:
+        """
+        Order a query by (created_at, id) and apply a page window.
+
+        With a cursor the page starts right after the cursor's row (keyset
+        pagination, constant cost per page); without one ``skip`` is used
+        as an OFFSET for backwards compatibility.
+
+        Args:
+            query: Query to paginate
+            skip: Number of records to skip when no cursor is given
+            limit: Maximum number of records to return
+            cursor: Opaque cursor from a previous page
+            sort: Sort order for created_at ("asc" or "desc")
+
+        Returns:
+            Paginated query
+        """
+        position = tuple_(self.model.created_at, self.model.id)
+
+        if cursor is not None:
+            bound = tuple_(*map(literal, decode_cursor(cursor)))
+            query = query.where(position < bound if sort == "desc" else position > bound)
+        else:
+            query = query.offset(skip)
+
+        if sort == "desc":
+            query = query.order_by(self.model.created_at.desc(), self.model.id.desc())
+        else:
+            query = query.order_by(self.model.created_at.asc(), self.model.id.asc())
+
+        return query.limit(limit)
 
     async def get_all(
-        self, skip: int = 0, limit: int = 100, **filters
-    ) -> List[ModelType]:
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        schema: Optional[Type[SchemaType]] = None,
+        **filters,
+    ) -> Union[List[ModelType], List[SchemaType]]:
         """
         Get all records with optional filtering and pagination.
 
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Opaque keyset cursor, newest first (overrides skip)
+            schema: Response schema to select columns for and return
             **filters: Filter criteria (e.g., is_active=True)
 
         Returns:
-            List of model instances
+            List of model instances, or of schema instances if given
         """
-        query = select(self.model)
+        query = self._select(schema)
 
         # Apply filters
         for key, value in filters.items():
             if hasattr(self.model, key):
                 query = query.where(getattr(self.model, key) == value)
 
-        query = query.offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return await self._fetch(self._paginate(query, skip, limit, cursor), schema)
+
+    def _where_id(self, id: UUID, filters: Optional[dict[str, Any]]) -> list:
+        """Build ``id == :id`` plus equality predicates from filters."""
+        criteria = [self.model.id == id]
+        for key, value in (filters or {}).items():
+            criteria.append(getattr(self.model, key) == value)
+        return criteria
 
-    async def update(self, id: UUID, **kwargs) -> Optional[ModelType]:
+    async def update(
+        self, id: UUID, filters: Optional[dict[str, Any]] = None, **kwargs
+    ) -> Optional[ModelType]:
         """
-        Update a record by ID.
+        Update a record by ID in a single UPDATE ... RETURNING statement.
 
         Args:
             id: Record ID
+            filters: Extra equality predicates the row must match
+                (e.g. {"user_id": owner_id} for ownership checks)
             **kwargs: Attributes to update
 
         Returns:
-            Updated model instance or None
+            Updated model instance or None if no row matched
         """
-        # Get the instance first
-        instance = await self.get_by_id(id)
-        if not instance:
-            return None
+        columns = inspect(self.model).column_attrs.keys()
+        values = {key: value for key, value in kwargs.items() if key in columns}
+        criteria = self._where_id(id, filters)
 
-        # Update attributes
-        for key, value in kwargs.items():
-            if hasattr(instance, key):
-                setattr(instance, key, value)
+        if not values:
+            result = await self.session.execute(select(self.model).where(*criteria))
+            return result.scalar_one_or_none()
 
-        await self.session.flush()
-        await self.session.refresh(instance)
-        return instance
+        result = await self.session.execute(
+            update(self.model)
+            .where(*criteria)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        return result.scalar_one_or_none()
 
-    async def delete(self, id: UUID) -> bool:
+    async def delete(
+        self, id: UUID, filters: Optional[dict[str, Any]] = None
+    ) -> bool:
         """
-        Delete a record by ID.
+        Delete a record by ID in a single DELETE ... RETURNING statement.
 
         Args:
             id: Record ID
+            filters: Extra equality predicates the row must match
 
         Returns:
             True if deleted, False if not found
         """
-        instance = await self.get_by_id(id)
-        if not instance:
-            return False
-
-        await self.session.delete(instance)
-        await self.session.flush()
-        return True
+        result = await self.session.execute(
+            delete(self.model)
+            .where(*self._where_id(id, filters))
+            .returning(self.model.id)
+            .execution_options(synchronize_session="fetch")
+        )
+        deleted = result.scalar_one_or_none() is not None
+        if deleted:
+            get_loader(self.session).prime(self.model, id, None)
+        return deleted
+
+    def _where(self, filters: dict[str, Any]) -> list:
+        """Build equality predicates for filters on known columns."""
+        return [
+            getattr(self.model, key) == value
+            for key, value in filters.items()
+            if hasattr(self.model, key)
+        ]
 
     async def exists(self, **filters) -> bool:
         """
         Check if a record exists with given filters.
 
+        Runs SELECT EXISTS(...), which stops at the first match and
+        transfers no row data.
+
         Args:
             **filters: Filter criteria
 
         Returns:
             True if exists, False otherwise
         """
-        query = select(self.model)
-        for key, value in filters.items():
-            if hasattr(self.model, key):
-                query = query.where(getattr(self.model, key) == value)
-
-        result = await self.session.execute(query)
-        return result.scalar_one_or_none() is not None
+        query = select(self.model.id).where(*self._where(filters))
+        result = await self.session.execute(select(query.exists()))
+        return result.scalar_one()
 
-    async def count(self, **filters) -> int:
+    async def count(
+        self, mode: Literal["exact", "estimated", "cached"] = "exact", **filters
+    ) -> int:
         """
         Count records matching filters.
 
         Args:
+            mode: "exact" runs COUNT(*); "estimated" reads the planner's
+                row estimate (pg_class.reltuples when unfiltered) without
+                scanning; "cached" is an exact count reused for
+                COUNT_CACHE_TTL seconds
             **filters: Filter criteria
 
         Returns:
             Number of matching records
         """
-        from sqlalchemy import func
+        if mode == "estimated":
+            return await self._estimated_count(filters)
 
-        query = select(func.count()).select_from(self.model)
-        for key, value in filters.items():
-            if hasattr(self.model, key):
-                query = query.where(getattr(self.model, key) == value)
+        if mode == "cached":
+            key = (self.model.__tablename__, tuple(sorted(filters.items())))
+            total = _count_cache.get(key)
+            if total is None:
+                total = await self._exact_count(filters)
+                _count_cache.set(key, total)
+            return total
+
+        return await self._exact_count(filters)
 
+    async def _exact_count(self, filters: dict[str, Any]) -> int:
+        query = select(func.count()).select_from(self.model).where(*self._where(filters))
         result = await self.session.execute(query)
         return result.scalar_one()
+
+    async def _estimated_count(self, filters: dict[str, Any]) -> int:
+        criteria = self._where(filters)
+
+        # reltuples per table, or per leaf partition of a partitioned table
+        result = await self.session.execute(
+            text(
+                "SELECT pg_class.relname, pg_class.reltuples "
+                "FROM pg_partition_tree(CAST(:table AS regclass)) AS tree "
+                "JOIN pg_class ON pg_class.oid = tree.relid WHERE tree.isleaf"
+            ),
+            {"table": self.model.__tablename__},
+        )
+        reltuples: dict[str, float] = {name: tuples for name, tuples in result.all()}
+
+        if not criteria:
+            # Negative until a table has been vacuumed or analyzed
+            if any(tuples >= 0 for tuples in reltuples.values()):
+                return int(sum(max(tuples, 0) for tuples in reltuples.values()))
+            return await self._exact_count(filters)
+
+        query = select(self.model.id).where(*criteria).compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+        # Sent as is: text() would read colons in literals as bind parameters
+        connection = await self.session.connection()
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {query}")
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(_plan_rows(plan[0]["Plan"], reltuples))
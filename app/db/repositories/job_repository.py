@@ -1,20 +1,141 @@
 """Job repository for applications specific"""
 
+import uuid
+from datetime import datetime
+from typing import Any, Optional, Type
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    Select,
+    cast,
+    column,
+    false,
+    func,
+    inspect,
+    literal,
+    literal_column,
+    true,
+    tuple_,
+    union_all,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import array, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import select
 
-from app.db.models.job import JobPosting
-from app.db.repositories.base import BaseRepository
+from app.db.models.job import (
+    CONTENT_HASH_FIELDS,
+    SEARCH_CONFIG,
+    JobPosting,
+    JobPostingKey,
+    PlatformEnum,
+    content_fingerprint,
+)
+from app.db.repositories.base import BulkWriteResult, BaseRepository, SchemaType
+from app.db.types import normalize_skills
+from app.utils.pagination import decode_rank_cursor
+from app.utils.preview import preview_column
+
+
+def _with_content_hash(values: dict[str, Any], inserting: bool) -> dict[str, Any]:
+    """
+    Keep content_hash in step with written values.
+
+    Inserts always get a fingerprint (a missing budget is NULL). Updates
+    get one only when they set every hashed column; a partial content
+    update clears it so the next upsert rewrites the row.
+    """
+    if inserting or all(field in values for field in CONTENT_HASH_FIELDS):
+        return {
+            **values,
+            "content_hash": content_fingerprint(
+                values["job_title"],
+                values["description"],
+                values.get("budget"),
+                values["required_skills"],
+                values["platform"],
+            ),
+        }
+    if any(field in values for field in CONTENT_HASH_FIELDS):
+        return {**values, "content_hash": None}
+    return values
 
 
 class JobPostingRepository(BaseRepository[JobPosting]):
     """Job repository"""
 
+    computed_columns = {
+        "description_preview": preview_column(JobPosting.description),
+    }
+
     def __init__(self, session: AsyncSession):
         """Initialize job repository."""
 
         super().__init__(JobPosting, session)
 
+    async def create(self, **kwargs) -> JobPosting:
+        """Create a job posting with its content fingerprint."""
+
+        return await super().create(**_with_content_hash(kwargs, inserting=True))
+
+    async def update(
+        self, id: UUID, filters: Optional[dict[str, Any]] = None, **kwargs
+    ) -> Optional[JobPosting]:
+        """Update a job posting, keeping its content fingerprint valid."""
+
+        return await super().update(
+            id, filters, **_with_content_hash(kwargs, inserting=False)
+        )
+
+    async def bulk_create(
+        self, rows: list[dict[str, Any]], chunk_size: int = 1000
+    ) -> BulkWriteResult:
+        """Insert many job postings with their content fingerprints."""
+
+        return await super().bulk_create(
+            [_with_content_hash(row, inserting=True) for row in rows], chunk_size
+        )
+
+    async def bulk_upsert(
+        self,
+        rows: list[dict[str, Any]],
+        conflict_columns: list[str],
+        update_columns: Optional[list[str]] = None,
+        chunk_size: int = 1000,
+    ) -> BulkWriteResult:
+        """
+        Upsert many job postings with their content fingerprints.
+
+        Conflicts on url are resolved through job_posting_keys (see
+        ``_upsert_on_url``); job_postings itself has no unique url index.
+        """
+        if update_columns and set(update_columns) & set(CONTENT_HASH_FIELDS):
+            update_columns = [*update_columns, "content_hash"]
+        rows = [_with_content_hash(row, inserting=True) for row in rows]
+        if conflict_columns != ["url"]:
+            return await super().bulk_upsert(
+                rows, conflict_columns, update_columns, chunk_size
+            )
+
+        unique_rows = {row["url"]: row for row in rows}
+        result = BulkWriteResult()
+        for chunk in self._chunks(list(unique_rows.values()), chunk_size):
+            upserted = await self.session.execute(
+                self._upsert_on_url(
+                    chunk, update_columns, guarded=False, returning=["id"]
+                )
+            )
+            for id, inserted in upserted.all():
+                result.ids.append(id)
+                if inserted:
+                    result.inserted += 1
+                else:
+                    result.updated += 1
+        return result
+
     async def get_by_url(self, url: str) -> JobPosting | None:
         """Get job posting by URL."""
 
@@ -23,3 +144,381 @@ class JobPostingRepository(BaseRepository[JobPosting]):
         )
 
         return results.scalar_one_or_none()
+
+    async def get_filtered(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        schema: Optional[Type[SchemaType]] = None,
+        skills_any: Optional[list[str]] = None,
+        skills_all: Optional[list[str]] = None,
+        platforms: Optional[list[PlatformEnum]] = None,
+        budget_min: Optional[float] = None,
+        budget_max: Optional[float] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> list[JobPosting] | list[SchemaType]:
+        """
+        Get job postings matching every given filter, newest first.
+
+        Skill filters are answered by the GIN index on required_skills
+        (skill names are matched case-insensitively); the other filters by
+        the platform, budget and created_at indexes.
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            cursor: Opaque keyset cursor (overrides skip)
+            schema: Response schema to project onto
+            skills_any: Postings requiring at least one of these skills
+            skills_all: Postings requiring all of these skills
+            platforms: Postings from one of these platforms
+            budget_min: Minimum budget (inclusive)
+            budget_max: Maximum budget (inclusive)
+            created_after: Posted at or after this time
+            created_before: Posted before this time
+
+        Returns:
+            List of job postings, or of schema instances if given
+        """
+        query = self._select(schema)
+
+        if skills_all:
+            # Bound through SkillList, which normalizes the names
+            query = query.where(JobPosting.required_skills.contains(skills_all))
+        if skills_any:
+            query = query.where(
+                JobPosting.required_skills.has_any(array(normalize_skills(skills_any)))
+            )
+        if platforms:
+            query = query.where(JobPosting.platform.in_(platforms))
+        if budget_min is not None:
+            query = query.where(JobPosting.budget >= budget_min)
+        if budget_max is not None:
+            query = query.where(JobPosting.budget <= budget_max)
+        if created_after is not None:
+            query = query.where(JobPosting.created_at >= created_after)
+        if created_before is not None:
+            query = query.where(JobPosting.created_at < created_before)
+
+        return await self._fetch(self._paginate(query, skip, limit, cursor), schema)
+
+    def _search_query(
+        self,
+        q: str,
+        schema: Type[SchemaType],
+        platforms: Optional[list[PlatformEnum]] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Select:
+        """Build the query behind ``search``."""
+        search_vector = JobPosting.__table__.c.search_vector
+        config: ColumnElement[Any] = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+        tsquery = func.websearch_to_tsquery(config, q)
+        rank = func.ts_rank(search_vector, tsquery)
+
+        query = (
+            self._select(schema)
+            .add_columns(rank.label("rank"))
+            .where(search_vector.bool_op("@@")(tsquery))
+        )
+        if platforms:
+            query = query.where(JobPosting.platform.in_(platforms))
+        if cursor is not None:
+            query = query.where(
+                tuple_(rank, JobPosting.id)
+                < tuple_(*map(literal, decode_rank_cursor(cursor)))
+            )
+
+        return query.order_by(rank.desc(), JobPosting.id.desc()).limit(limit)
+
+    async def search(
+        self,
+        q: str,
+        schema: Type[SchemaType],
+        platforms: Optional[list[PlatformEnum]] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> list[SchemaType]:
+        """
+        Full-text search over job titles and descriptions, best match first.
+
+        Matches come from the GIN index on search_vector; title hits weigh
+        more than description hits. Pages continue after a (rank, id)
+        cursor.
+
+        Args:
+            q: Search text in web search syntax ("quoted phrase", -exclude, or)
+            schema: Response schema to project onto; may declare a rank field
+            platforms: Only return postings from these platforms
+            limit: Maximum number of results to return
+            cursor: Opaque cursor from a previous page of the same search
+
+        Returns:
+            List of schema instances
+        """
+        query = self._search_query(q, schema, platforms, limit, cursor)
+        return await self._fetch(query, schema)
+
+    def _upsert_on_url(
+        self,
+        rows: list[dict[str, Any]],
+        update_columns: Optional[list[str]],
+        guarded: bool,
+        returning: Optional[list[str]] = None,
+    ) -> Select | CompoundSelect:
+        """
+        Build one statement that inserts or updates job postings by URL.
+
+        job_postings is partitioned and cannot hold a unique index on url,
+        so the ON CONFLICT (url) runs against job_posting_keys: each URL is
+        claimed there under a fresh id, or its existing key row is locked,
+        which serializes concurrent writers of the same URL. Postings whose
+        URL was claimed are inserted under the new id; the others are
+        updated by id. Known URLs whose posting was archived or is not yet
+        visible to this statement come back from neither.
+
+        Args:
+            rows: Column values per posting, all with the same keys (one per URL)
+            update_columns: Columns to overwrite for known URLs (None to only
+                insert new ones)
+            guarded: Skip updates that would leave content_hash unchanged
+            returning: Columns to return (default: every mapped column)
+
+        Returns:
+            Statement returning the written postings' columns and whether
+            each was inserted
+        """
+        table = JobPosting.__table__
+        keys = JobPostingKey.__table__
+        names = list(rows[0])
+        data = values(
+            column("id", keys.c.id.type),
+            *(column(name, table.c[name].type) for name in names),
+            name="data",
+        ).data([(uuid.uuid4(), *(row[name] for name in names)) for row in rows])
+
+        # A VALUES column that is NULL in every row is typed text otherwise
+        typed = {name: cast(data.c[name], table.c[name].type) for name in names}
+
+        claim = pg_insert(keys).from_select(
+            ["id", "url"], select(data.c.id, data.c.url)
+        )
+        claimed = (
+            claim.on_conflict_do_update(
+                index_elements=[keys.c.url], set_={"url": claim.excluded.url}
+            )
+            .returning(
+                keys.c.id, keys.c.url, literal_column("(xmax = 0)").label("claimed")
+            )
+            .cte("claimed")
+        )
+
+        if returning is None:
+            returning = [column.key for column in inspect(JobPosting).columns]
+        returned = [table.c[name] for name in returning]
+
+        inserted = (
+            pg_insert(table)
+            .from_select(
+                ["id", *names],
+                select(claimed.c.id, *(typed[name] for name in names))
+                .select_from(data.join(claimed, claimed.c.url == data.c.url))
+                .where(claimed.c.claimed),
+            )
+            .returning(*returned, true().label("inserted"))
+            .cte("inserted")
+        )
+        if not update_columns:
+            return select(inserted)
+
+        update_stmt = (
+            update(table)
+            .where(
+                table.c.id == claimed.c.id,
+                claimed.c.url == data.c.url,
+                ~claimed.c.claimed,
+            )
+            .values({name: typed[name] for name in update_columns})
+        )
+        if guarded:
+            update_stmt = update_stmt.where(
+                table.c.content_hash.is_distinct_from(typed["content_hash"])
+            )
+        updated = update_stmt.returning(*returned, false().label("inserted")).cte(
+            "updated"
+        )
+        return union_all(select(inserted), select(updated))
+
+    async def _restore_archived(self, rows: list[dict[str, Any]]) -> list[JobPosting]:
+        """
+        Insert postings whose URL key outlived their archived partition.
+
+        Keys referenced by applications are kept when a partition is
+        archived; the posting comes back under the same id. Callers hold
+        the key rows' locks from ``_upsert_on_url``.
+
+        Args:
+            rows: Complete column values per posting
+
+        Returns:
+            Restored job postings
+        """
+        keys = await self.session.execute(
+            select(JobPostingKey.url, JobPostingKey.id).where(
+                JobPostingKey.url.in_([row["url"] for row in rows])
+            )
+        )
+        ids: dict[str, uuid.UUID] = {url: id for url, id in keys.all()}
+        result = await self.session.execute(
+            pg_insert(JobPosting)
+            .values([{**row, "id": ids[row["url"]]} for row in rows])
+            .returning(JobPosting)
+        )
+        return list(result.scalars().all())
+
+    async def upsert_by_url(self, **values: Any) -> tuple[JobPosting, bool, bool]:
+        """
+        Insert a job posting or update the one with the same URL.
+
+        An indexed lookup on url comes first: if the stored content_hash
+        matches, nothing is written. Otherwise a single statement claims
+        the URL and inserts or updates the row, guarded on the fingerprint
+        (see ``_upsert_on_url``), so concurrent upserts of the same URL are
+        safe.
+
+        Args:
+            **values: Job posting columns, including url and every
+                non-nullable column
+
+        Returns:
+            Job posting, True if it was inserted, True if anything changed
+        """
+        values = _with_content_hash(values, inserting=True)
+
+        existing = await self.get_by_url(values["url"])
+        if existing is not None and existing.content_hash == values["content_hash"]:
+            return existing, False, False
+
+        stmt = self._upsert_on_url(
+            [values], [key for key in values if key != "url"], guarded=True
+        )
+        result = await self.session.execute(
+            select(JobPosting, literal_column("inserted"))
+            .from_statement(stmt)
+            .execution_options(populate_existing=True)
+        )
+        row = result.one_or_none()
+        if row is not None:
+            job, inserted = row
+            return job, inserted, True
+
+        # A concurrent writer stored the same URL first
+        existing = await self.get_by_url(values["url"])
+        if existing is not None:
+            return existing, False, False
+
+        (job,) = await self._restore_archived([values])
+        return job, True, True
+
+    async def update_by_url(
+        self, url: str, **values: Any
+    ) -> tuple[JobPosting | None, bool]:
+        """
+        Update the job posting with the given URL if its content differs.
+
+        Args:
+            url: Job posting URL
+            **values: Columns to update
+
+        Returns:
+            Job posting (None if no posting has this URL) and True if
+            anything changed
+        """
+        existing = await self.get_by_url(url)
+        if existing is None:
+            return None, False
+
+        if all(getattr(existing, key) == value for key, value in values.items()):
+            return existing, False
+
+        merged = {field: getattr(existing, field) for field in CONTENT_HASH_FIELDS}
+        merged.update(values)
+
+        result = await self.session.execute(
+            update(JobPosting)
+            # created_at limits the update to the posting's partition
+            .where(
+                JobPosting.id == existing.id,
+                JobPosting.created_at == existing.created_at,
+            )
+            .values(**_with_content_hash(merged, inserting=False))
+            .returning(JobPosting)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        return result.scalar_one(), True
+
+    async def upsert_many_by_url(
+        self, rows: list[dict[str, Any]]
+    ) -> dict[str, tuple[UUID, bool, bool]]:
+        """
+        Upsert many complete job postings.
+
+        One indexed lookup finds postings whose content_hash already
+        matches; those are skipped and the rest are written with a single
+        fingerprint-guarded upsert statement (see ``_upsert_on_url``).
+        Rows repeating a URL are collapsed (last wins).
+
+        Args:
+            rows: Job posting columns per posting, all with the same keys
+
+        Returns:
+            Mapping of URL to (job posting id, True if inserted, True if
+            anything changed)
+        """
+        unique_rows = {
+            row["url"]: _with_content_hash(row, inserting=True) for row in rows
+        }
+
+        existing = await self.session.execute(
+            select(JobPosting.url, JobPosting.id, JobPosting.content_hash).where(
+                JobPosting.url.in_(list(unique_rows))
+            )
+        )
+        results = {}
+        for url, id, content_hash in existing.all():
+            if unique_rows[url]["content_hash"] == content_hash:
+                results[url] = (id, False, False)
+                del unique_rows[url]
+
+        if not unique_rows:
+            return results
+
+        columns = [key for key in next(iter(unique_rows.values())) if key != "url"]
+        upserted = await self.session.execute(
+            self._upsert_on_url(
+                list(unique_rows.values()),
+                columns,
+                guarded=True,
+                returning=["url", "id"],
+            )
+        )
+        for url, id, inserted in upserted.all():
+            results[url] = (id, inserted, True)
+
+        missing = [url for url in unique_rows if url not in results]
+        if missing:
+            # Concurrent writers stored the same URLs first
+            concurrent = await self.session.execute(
+                select(JobPosting.url, JobPosting.id).where(JobPosting.url.in_(missing))
+            )
+            for url, id in concurrent.all():
+                results[url] = (id, False, False)
+
+            archived = [unique_rows[url] for url in missing if url not in results]
+            if archived:
+                for job in await self._restore_archived(archived):
+                    results[job.url] = (job.id, True, True)
+
+        return results
@@ -65,7 +65,13 @@ class UserRepository(BaseRepository[User]):
         )
         return result.scalar_one_or_none()
 
-    async def get_by_role(self, role: UserRole, skip: int = 0, limit: int = 100) -> List[User]:
+    async def get_by_role(
+        self,
+        role: UserRole,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> List[User]:
         """
         Get users by role.
 
@@ -73,27 +79,28 @@ class UserRepository(BaseRepository[User]):
             role: User role
             skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Opaque keyset cursor (overrides skip)
 
         Returns:
             List of users with the specified role
         """
         result = await self.session.execute(
-            select(User)
-            .where(User.role == role)
-            .offset(skip)
-            .limit(limit)
+            self._paginate(select(User).where(User.role == role), skip, limit, cursor)
         )
         return list(result.scalars().all())
 
-    async def get_active_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+    async def get_active_users(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[User]:
         """
         Get active users.
 
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Opaque keyset cursor (overrides skip)
 
         Returns:
             List of active users
         """
-        return await self.get_all(skip=skip, limit=limit, is_active=True)
+        return await self.get_all(skip=skip, limit=limit, cursor=cursor, is_active=True)
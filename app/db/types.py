@@ -0,0 +1,31 @@
+"""Custom column types."""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import TypeDecorator
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+def normalize_skills(skills: Optional[Iterable[str]]) -> Optional[list[str]]:
+    """Lowercase and trim skill names, dropping blanks and duplicates (keeps order)."""
+    if skills is None:
+        return None
+    return list(dict.fromkeys(s.strip().lower() for s in skills if s and s.strip()))
+
+
+class SkillList(TypeDecorator):
+    """
+    JSONB array of normalized skill tokens.
+
+    Every value bound to the column, including containment filters, is
+    normalized, so GIN-indexed lookups match however a skill was typed.
+    """
+
+    impl = JSONB
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        """Normalize skill names before storage or comparison."""
+        if isinstance(value, (list, tuple)):
+            return normalize_skills(value)
+        return value
@@ -15,8 +15,10 @@ from app.core.exceptions import (
     general_exception_handler,
 )
 from app.core.redis import redis_client
+from app.core.security import password_hash_pool
 from app.api.v1.router import api_router
-from app.db.database import init_db
+from app.db.database import QueryStatsMiddleware, init_db
+from app.utils.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -30,7 +32,7 @@ async def lifespan(app: FastAPI):
     await redis_client.connect(settings.REDIS_URL)
     yield
     # Shutdown
-    pass
+    password_hash_pool.shutdown()
 
 
 app = FastAPI(
@@ -57,8 +59,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER],
 )
 
+# SQL statement count and time per request (Server-Timing header)
+app.add_middleware(QueryStatsMiddleware)
+
 # Exception handlers
 app.add_exception_handler(AppException, app_exception_handler)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
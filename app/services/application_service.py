@@ -1,7 +1,7 @@
 """Application Service for create, get, delete"""
 
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Literal, Optional, cast
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,8 +9,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.v1.schemas.application import (
     ApplicationCreate,
     ApplicationResponse,
+    ApplicationSummary,
     ApplicationUpdate,
 )
+from app.api.v1.schemas.job import JobPostingBrief
 from app.core.exceptions import NotFoundError
 from app.db.models.application import ApplicationStatus
 from app.db.repositories.application_repository import ApplicationRepository
@@ -60,7 +62,10 @@ class ApplicationService:
         limit: int = 20,
         status: Optional[ApplicationStatus] = None,
         sort: Literal["asc", "desc"] = "desc",
-    ) -> list[ApplicationResponse]:
+        cursor: Optional[str] = None,
+        view: Literal["full", "summary"] = "full",
+        include: Optional[Literal["job"]] = None,
+    ) -> list[ApplicationResponse] | list[ApplicationSummary]:
         """Get applications by user ID.
 
         Args:
@@ -69,16 +74,29 @@ class ApplicationService:
             limit: Maximum number of applications to return
             status: Optional application status filter
             sort: Sort order for created_at ("asc" or "desc")
+            cursor: Opaque keyset cursor from a previous page (overrides skip)
+            view: "summary" returns a proposal preview instead of the text
+            include: "job" embeds each application's job posting, loaded
+                in the same query
 
         Returns:
-            List of application responses
+            List of application responses or summaries
         """
 
+        schema = ApplicationSummary if view == "summary" else ApplicationResponse
         applications = await self.repository.get_by_user_id(
-            user_id, skip, limit, status, sort
+            user_id,
+            skip,
+            limit,
+            status,
+            sort,
+            cursor,
+            schema=schema,
+            job_schema=JobPostingBrief if include == "job" else None,
+        )
+        return cast(
+            list[ApplicationResponse] | list[ApplicationSummary], applications
         )
-
-        return [ApplicationResponse.model_validate(app) for app in applications]
 
     async def get_application(
         self, user_id: UUID, application_id: UUID
@@ -113,24 +131,17 @@ class ApplicationService:
             Application ApplicationResponse
         """
 
-        application = await self.repository.get_by_application_id(
-            user_id, application_id
-        )
-
-        if not application:
-            raise NotFoundError("Application not found")
-        submitted_at = (
-            datetime.utcnow()
-            if payload.status == ApplicationStatus.submitted
-            else application.submitted_at
-        )
+        values = payload.model_dump(exclude_unset=True)
+        if payload.status == ApplicationStatus.submitted:
+            values["submitted_at"] = datetime.utcnow()
 
         updated_app = await self.repository.update(
-            id=application_id,
-            **payload.model_dump(exclude_unset=True),
-            submitted_at=submitted_at,
+            application_id, filters={"user_id": user_id}, **values
         )
 
+        if not updated_app:
+            raise NotFoundError("Application not found")
+
         return ApplicationResponse.model_validate(updated_app)
 
     async def delete_application(self, user_id: UUID, application_id: UUID) -> bool:
@@ -141,16 +152,14 @@ class ApplicationService:
             application_id: Application ID
 
         Returns:
-            Application ApplicationResponse
+            True if the application was deleted
         """
 
-        application = await self.repository.get_by_application_id(
-            user_id, application_id
+        deleted = await self.repository.delete(
+            application_id, filters={"user_id": user_id}
         )
 
-        if not application:
+        if not deleted:
             raise NotFoundError("Application not found")
 
-        return await self.repository.delete(
-            id=application_id,
-        )
+        return deleted
@@ -6,8 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.security import (
-    verify_password,
-    get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token,
     create_refresh_token,
     decode_token,
@@ -81,7 +81,7 @@ class AuthService:
             raise BadRequestError("Username already taken")
 
         # Create new user
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
         new_user = await self.repository.create(
         email=user_data.email,
         username=user_data.username,
@@ -117,7 +117,9 @@ class AuthService:
         # Find user by username or email
         user = await self.repository.get_by_email_or_username(username_or_email)
 
-        if not user or not verify_password(password, user.password_hash):
+        if not user or not await verify_password_async(
+            password, str(user.password_hash)
+        ):
             raise UnauthorizedError("Incorrect username or password")
 
         if not user.is_active:
@@ -1,16 +1,28 @@
 """Job Service for create, get, delete"""
 
+from typing import Literal, Optional, cast
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.job import (
+    JobPostingBatch,
+    JobPostingBatchItemResult,
+    JobPostingBatchResponse,
     JobPostingCreate,
     JobPostingResponse,
+    JobPostingSearchResult,
+    JobPostingSummary,
     JobPostingUpsert,
+    JobPostingUpsertResponse,
 )
+from app.core.exceptions import BadRequestError
+from app.db.models.job import JobPosting, PlatformEnum
 from app.db.repositories.job_repository import JobPostingRepository
 
+# Columns a new job posting cannot be inserted without
+REQUIRED_FIELDS = ("platform", "job_title", "description", "required_skills")
+
 
 class JobPostingService:
     """Job Service"""
@@ -24,6 +36,16 @@ class JobPostingService:
         """
         self.repository = JobPostingRepository(session)
 
+    def _to_upsert_response(
+        self, job: JobPosting, created: bool, changed: bool
+    ) -> JobPostingUpsertResponse:
+        """Convert an upserted JobPosting to JobPostingUpsertResponse."""
+        return JobPostingUpsertResponse(
+            **JobPostingResponse.model_validate(job).model_dump(),
+            created=created,
+            changed=changed,
+        )
+
     async def create_jobposting(self, payload: JobPostingCreate) -> JobPostingResponse:
         """
         Create a new job posting.
@@ -65,20 +87,137 @@ class JobPostingService:
 
         return JobPostingResponse.model_validate(updated_job)
 
-    async def get_jobpostings(self, skip: int, limit: int) -> list[JobPostingResponse]:
+    async def upsert_jobposting(
+        self, payload: JobPostingUpsert
+    ) -> JobPostingUpsertResponse:
+        """
+        Create a job posting, or update the existing one with the same URL.
+        Complete payloads are written with one atomic upsert; partial
+        payloads can only update an existing posting. Nothing is written
+        when the posting's content is unchanged.
+        Args:
+            payload: Job posting data
+
+        Returns:
+            JobPostingUpsertResponse: Job posting, whether it was created and
+                whether anything changed
+
+        Raises:
+            BadRequestError: If a partial payload targets an unknown URL
+        """
+
+        values = payload.model_dump(exclude_unset=True, exclude={"url"})
+        missing = [field for field in REQUIRED_FIELDS if values.get(field) is None]
+        url = str(payload.url)
+
+        if not missing:
+            job, created, changed = await self.repository.upsert_by_url(
+                url=url, **values
+            )
+        else:
+            for field in missing:
+                values.pop(field, None)
+            updated, changed = await self.repository.update_by_url(url, **values)
+            if updated is None:
+                raise BadRequestError(
+                    f"New job posting is missing fields: {', '.join(missing)}"
+                )
+            job, created = updated, False
+
+        return self._to_upsert_response(job, created, changed)
+
+    async def upsert_jobpostings(
+        self, payload: JobPostingBatch
+    ) -> JobPostingBatchResponse:
+        """
+        Create or update a batch of complete job postings, skipping those
+        whose content is unchanged.
+        Args:
+            payload: Batch of job postings
+
+        Returns:
+            JobPostingBatchResponse: Per-item results in request order
         """
-        Get a list of job postings.
+
+        rows = [
+            {**item.model_dump(exclude={"url"}), "url": str(item.url)}
+            for item in payload.items
+        ]
+        upserted = await self.repository.upsert_many_by_url(rows)
+
+        results = []
+        for row in rows:
+            id, inserted, changed = upserted[row["url"]]
+            results.append(
+                JobPostingBatchItemResult(
+                    url=row["url"], id=id, created=inserted, changed=changed
+                )
+            )
+        created = sum(inserted for _, inserted, _ in upserted.values())
+        unchanged = sum(not changed for _, _, changed in upserted.values())
+
+        return JobPostingBatchResponse(
+            results=results,
+            created=created,
+            updated=len(upserted) - created - unchanged,
+            unchanged=unchanged,
+        )
+
+    async def get_jobpostings(
+        self,
+        skip: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        view: Literal["full", "summary"] = "full",
+        **filters,
+    ) -> list[JobPostingResponse] | list[JobPostingSummary]:
+        """
+        Get a list of job postings, newest first.
         Args:
             skip: Number of job postings to skip
             limit: Maximum number of job postings to return
+            cursor: Opaque keyset cursor from a previous page (overrides skip)
+            view: "summary" returns a description preview instead of the text
+            **filters: skills_any, skills_all, platforms, budget_min,
+                budget_max, created_after, created_before
+                (see JobPostingRepository.get_filtered)
 
         Returns:
-            list[JobPostingResponse]: List of job postings
+            list[JobPostingResponse | JobPostingSummary]: List of job postings
         """
 
-        results = await self.repository.get_all(skip=skip, limit=limit)
+        schema = JobPostingSummary if view == "summary" else JobPostingResponse
+        jobs = await self.repository.get_filtered(
+            skip=skip, limit=limit, cursor=cursor, schema=schema, **filters
+        )
+        return cast(list[JobPostingResponse] | list[JobPostingSummary], jobs)
+
+    async def search_jobpostings(
+        self,
+        q: str,
+        platforms: Optional[list[PlatformEnum]] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> list[JobPostingSearchResult]:
+        """
+        Search job postings by title and description, best match first.
+        Args:
+            q: Search text (web search syntax)
+            platforms: Optional platform filter
+            limit: Maximum number of results to return
+            cursor: Opaque cursor from a previous page of the same search
+
+        Returns:
+            list[JobPostingSearchResult]: Matching job postings with rank
+        """
 
-        return [JobPostingResponse.model_validate(job) for job in results]
+        return await self.repository.search(
+            q,
+            schema=JobPostingSearchResult,
+            platforms=platforms,
+            limit=limit,
+            cursor=cursor,
+        )
 
     async def get_jobposting(self, id: UUID) -> JobPostingResponse | None:
         """
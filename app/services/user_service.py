@@ -1,9 +1,11 @@
 """User service with business logic."""
 
-from typing import List, Optional
+from typing import List, Optional, cast
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.principal_cache import principal_cache
+from app.db.database import after_commit
 from app.db.repositories.user_repository import UserRepository
 from app.db.models.user import User, UserRole
 from app.api.v1.schemas.user import UserResponse, UserUpdate
@@ -20,6 +22,7 @@ class UserService:
         Args:
             session: Database session
         """
+        self.session = session
         self.repository = UserRepository(session)
 
     def _to_response(self, user: User) -> UserResponse:
@@ -67,20 +70,23 @@ class UserService:
         return self._to_response(user)
 
     async def get_users(
-        self, skip: int = 0, limit: int = 20
+        self, skip: int = 0, limit: int = 20, cursor: Optional[str] = None
     ) -> List[UserResponse]:
         """
-        Get paginated list of users.
+        Get paginated list of users, newest first.
 
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Opaque keyset cursor from a previous page (overrides skip)
 
         Returns:
             List of UserResponse schemas
         """
-        users = await self.repository.get_all(skip=skip, limit=limit)
-        return [self._to_response(user) for user in users]
+        users = await self.repository.get_all(
+            skip=skip, limit=limit, cursor=cursor, schema=UserResponse
+        )
+        return cast(List[UserResponse], users)
 
     async def update_user(
         self, user_id: UUID, user_update: UserUpdate, partial: bool = True
@@ -122,6 +128,8 @@ class UserService:
         if not updated_user:
             raise NotFoundError("User not found")
 
+        # Once committed, or a concurrent request could cache the old role
+        after_commit(self.session, lambda: principal_cache.invalidate(user_id))
         return self._to_response(updated_user)
 
     async def update_user_role(
@@ -140,10 +148,6 @@ class UserService:
         Raises:
             NotFoundError: If user not found
         """
-        user = await self.repository.get_by_id(user_id)
-        if not user:
-            raise NotFoundError("User not found")
-
         is_admin = role == UserRole.ADMIN
         updated_user = await self.repository.update(
             user_id, role=role, is_admin=is_admin
@@ -151,6 +155,7 @@ class UserService:
         if not updated_user:
             raise NotFoundError("User not found")
 
+        after_commit(self.session, lambda: principal_cache.invalidate(user_id))
         return self._to_response(updated_user)
 
     async def toggle_user_activation(
@@ -169,14 +174,11 @@ class UserService:
         Raises:
             NotFoundError: If user not found
         """
-        user = await self.repository.get_by_id(user_id)
-        if not user:
-            raise NotFoundError("User not found")
-
         updated_user = await self.repository.update(user_id, is_active=is_active)
         if not updated_user:
             raise NotFoundError("User not found")
 
+        after_commit(self.session, lambda: principal_cache.invalidate(user_id))
         return self._to_response(updated_user)
 
     async def get_all_users(self) -> List[UserResponse]:
@@ -186,5 +188,14 @@ class UserService:
         Returns:
             List of UserResponse schemas
         """
-        users = await self.repository.get_all(skip=0, limit=1000)
-        return [self._to_response(user) for user in users]
+        users = await self.repository.get_all(skip=0, limit=1000, schema=UserResponse)
+        return cast(List[UserResponse], users)
+
+    async def count_users(self) -> int:
+        """
+        Get the approximate number of users (admin pagination totals).
+
+        Returns:
+            Planner estimate of the users table size
+        """
+        return await self.repository.count(mode="estimated")
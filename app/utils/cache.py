@@ -1,6 +1,8 @@
 from app.core.redis import redis_client
 import json
-from typing import Any, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
 
 DEFAULT_TTL = 60  # seconds
 
@@ -31,4 +33,52 @@ async def cache_delete(key: str):
     await redis.delete(cache_key(key))
 
 def cache_key(*args: Any) -> str:
-    return "cache:" + ":".join(map(str, args))
\ No newline at end of file
+    return "cache:" + ":".join(map(str, args))
+
+
+class TTLCache:
+    """In-process LRU cache whose entries expire after a TTL."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            self._data.pop(key, None)
+            return
+
+        self._data[key] = (self.clock() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,76 @@
+"""Opaque keyset cursors over (created_at, id) or, for search, (rank, id)."""
+
+import base64
+from datetime import datetime
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+from app.core.exceptions import BadRequestError
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+def _encode(*parts: Any) -> str:
+    raw = "|".join(str(part) for part in parts).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> list[str]:
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    return raw.split("|")
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Encode a row position as an opaque cursor."""
+    return _encode(created_at.isoformat(), id)
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        BadRequestError: If the cursor is malformed
+    """
+    try:
+        created_at, id = _decode(cursor)
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (ValueError, UnicodeDecodeError):
+        raise BadRequestError("Invalid cursor")
+
+
+def encode_rank_cursor(rank: float, id: UUID) -> str:
+    """Encode a search result position as an opaque cursor."""
+    # repr() round-trips the float exactly, so no row is skipped or repeated
+    return _encode(repr(rank), id)
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, UUID]:
+    """
+    Decode a cursor produced by ``encode_rank_cursor``.
+
+    Raises:
+        BadRequestError: If the cursor is malformed
+    """
+    try:
+        rank, id = _decode(cursor)
+        return float(rank), UUID(id)
+    except (ValueError, UnicodeDecodeError):
+        raise BadRequestError("Invalid cursor")
+
+
+def next_cursor(items: Sequence[Any], limit: int) -> Optional[str]:
+    """Cursor for the page after ``items``, or None on a short last page."""
+    if len(items) < limit or not items:
+        return None
+    last = items[-1]
+    return encode_cursor(last.created_at, last.id)
+
+
+def next_rank_cursor(items: Sequence[Any], limit: int) -> Optional[str]:
+    """Cursor for the search results after ``items``, or None on the last page."""
+    if len(items) < limit or not items:
+        return None
+    last = items[-1]
+    return encode_rank_cursor(last.rank, last.id)
@@ -0,0 +1,29 @@
+"""Truncated previews of long text columns for summary list views."""
+
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.config import settings
+
+ELLIPSIS = "…"
+
+
+def preview_column(column) -> ColumnElement:
+    """
+    SQL expression selecting the start of a text column.
+
+    Fetches one character more than the preview length so truncation can be
+    detected without reading the whole value; substr() lets Postgres
+    detoast only the leading chunks of a large value.
+    """
+    return func.substr(column, 1, settings.LIST_PREVIEW_LENGTH + 1)
+
+
+def truncate_preview(value: Optional[str]) -> Optional[str]:
+    """Cut a preview to LIST_PREVIEW_LENGTH characters, ellipsis included."""
+    limit = settings.LIST_PREVIEW_LENGTH
+    if value is None or len(value) <= limit:
+        return value
+    return value[: limit - 1].rstrip() + ELLIPSIS
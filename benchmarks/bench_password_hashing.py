@@ -0,0 +1,71 @@
+"""Benchmark event-loop lag while bcrypt logins run concurrently.
+
+Compares hashing inline on the event loop with hashing in the bounded
+worker pool. Run with: python benchmarks/bench_password_hashing.py
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.security import (
+    get_password_hash,
+    password_hash_pool,
+    verify_password,
+    verify_password_async,
+)
+
+CONCURRENT_LOGINS = 32
+TICK_INTERVAL = 0.005
+
+
+async def measure_lag(stop: asyncio.Event) -> list[float]:
+    """Record how late a periodic timer fires, in milliseconds."""
+    lags = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_INTERVAL)
+        lags.append((time.perf_counter() - start - TICK_INTERVAL) * 1000)
+    return lags
+
+
+async def inline_login(password: str, hashed: str) -> bool:
+    """Login path before the pool: bcrypt on the event loop."""
+    return verify_password(password, hashed)
+
+
+async def run(label: str, login) -> None:
+    hashed = get_password_hash("benchmark-password")
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_lag(stop))
+    await asyncio.sleep(TICK_INTERVAL * 2)
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(login("benchmark-password", hashed) for _ in range(CONCURRENT_LOGINS))
+    )
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    lags = sorted(await ticker)
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(
+        f"{label:<8} logins={CONCURRENT_LOGINS} total={elapsed:.2f}s "
+        f"ticks={len(lags)} lag_p50={statistics.median(lags):.1f}ms "
+        f"lag_p99={p99:.1f}ms lag_max={lags[-1]:.1f}ms"
+    )
+
+
+async def main():
+    await run("inline", inline_login)
+    await run("pool", verify_password_async)
+    password_hash_pool.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
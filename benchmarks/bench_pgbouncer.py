@@ -0,0 +1,66 @@
+"""Request throughput with a direct connection pool vs PgBouncer mode.
+
+Each simulated request opens a session, runs a few primary-key lookups and
+closes it, with CONCURRENCY requests in flight. "direct" uses the local
+connection pool and prepared statement cache against DATABASE_URL; "pgbouncer"
+uses DATABASE_PGBOUNCER mode (NullPool, no statement cache) against
+PGBOUNCER_URL, which defaults to DATABASE_URL to measure the mode's own cost.
+
+Run with: PGBOUNCER_URL=postgresql+asyncpg://...:6432/dbname \\
+    python benchmarks/bench_pgbouncer.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.db.database import _create_engine, _create_session_factory
+from app.db.models.user import User
+
+REQUESTS = 2_000
+CONCURRENCY = 20
+QUERIES_PER_REQUEST = 3
+
+
+async def run(label: str, url: str, pgbouncer: bool) -> None:
+    settings.DATABASE_PGBOUNCER = pgbouncer
+    engine = _create_engine(url)
+    session_factory = _create_session_factory(engine)
+    remaining = iter(range(REQUESTS))
+
+    async def worker():
+        for _ in remaining:
+            async with session_factory() as session:
+                for _ in range(QUERIES_PER_REQUEST):
+                    await session.get(User, uuid4())
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await engine.dispose()
+    print(
+        f"{label:<10} {REQUESTS / elapsed:>10,.0f} requests/s "
+        f"({elapsed / REQUESTS * 1e3:.2f}ms each)"
+    )
+
+
+async def main():
+    await run("direct", settings.DATABASE_URL, pgbouncer=False)
+    await run(
+        "pgbouncer",
+        os.environ.get("PGBOUNCER_URL", settings.DATABASE_URL),
+        pgbouncer=True,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
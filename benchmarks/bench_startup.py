@@ -0,0 +1,71 @@
+"""Worker startup: init_db vs the create_all it replaced, as tables grow.
+
+For each table count, extra tables are added to the schema, then each
+startup path runs ROUNDS times against DATABASE_URL (migrated to head).
+create_all reflects every table in turn; init_db checks them in one query,
+so its time should stay flat. The extra tables are dropped at the end.
+
+Run with: python benchmarks/bench_startup.py
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import Column, Integer, Table
+
+from app.db import models  # noqa: F401  (register models on Base)
+from app.db.database import Base, engine, init_db
+
+TABLE_COUNTS = [0, 50, 200, 500]
+ROUNDS = 5
+
+
+async def create_all() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def timed(startup) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await startup()
+    return (time.perf_counter() - start) / ROUNDS * 1e3
+
+
+async def main():
+    extra = []
+    # Connections and the migration scripts, loaded once per worker
+    await create_all()
+    await init_db()
+    try:
+        for count in TABLE_COUNTS:
+            while len(extra) < count:
+                extra.append(
+                    Table(
+                        f"bench_startup_{len(extra)}",
+                        Base.metadata,
+                        Column("id", Integer, primary_key=True),
+                    )
+                )
+            await create_all()
+
+            create_all_ms = await timed(create_all)
+            init_db_ms = await timed(init_db)
+            print(
+                f"{count:>4} extra tables  create_all {create_all_ms:>8.1f}ms  "
+                f"init_db {init_db_ms:>6.1f}ms"
+            )
+    finally:
+        async with engine.begin() as conn:
+            for table in extra:
+                await conn.run_sync(table.drop, checkfirst=True)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -8,11 +8,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import bcrypt
-from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import AsyncSessionLocal, engine
 from app.db.models.user import User, UserRole
 from app.db.repositories.user_repository import UserRepository
-from sqlalchemy import select
 
 
 def hash_password(password: str) -> str:
@@ -87,34 +85,26 @@ async def seed_users():
                 },
             ]
 
-            created_count = 0
-            skipped_count = 0
-
-            for user_data in normal_users:
-                # Check if user already exists
-                existing_user = await user_repository.get_by_email(user_data["email"])
-                if not existing_user:
-                    # Create User instance directly to properly handle enum
-                    new_user = User(
-                        email=user_data["email"],
-                        username=user_data["username"],
-                        password_hash=hash_password(user_data["password"]),
-                        full_name=user_data["full_name"],
-                        role=UserRole.USER,
-                        is_active=True,
-                        is_admin=False,
-                    )
-                    session.add(new_user)
-                    await session.flush()
-                    await session.refresh(new_user)
-                    await session.commit()
-                    print(
-                        f"✓ Created user: {user_data['username']} ({user_data['email']})"
-                    )
-                    created_count += 1
-                else:
-                    print(f"⊘ User already exists: {user_data['username']}")
-                    skipped_count += 1
+            # Insert all users in one statement, skipping existing emails
+            result = await user_repository.bulk_upsert(
+                [
+                    {
+                        "email": user_data["email"],
+                        "username": user_data["username"],
+                        "password_hash": hash_password(user_data["password"]),
+                        "full_name": user_data["full_name"],
+                        "role": UserRole.USER,
+                        "is_active": True,
+                        "is_admin": False,
+                    }
+                    for user_data in normal_users
+                ],
+                conflict_columns=["email"],
+            )
+            await session.commit()
+
+            created_count = result.inserted
+            skipped_count = len(normal_users) - result.inserted
 
             print("\n" + "=" * 50)
             print("Seeding Summary:")
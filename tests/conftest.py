@@ -1,21 +1,75 @@
 """Pytest configuration and fixtures."""
 
+from contextlib import contextmanager
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 
 from app.main import app
 from app.core.config import settings
-from app.db.database import get_db
+from app.db.database import (
+    Base,
+    get_db,
+    get_read_db,
+    get_snapshot_db,
+    track_queries,
+)
+from app.db import models  # noqa: F401  (register models on Base)
 
 # Test database
 TEST_DATABASE_URL = settings.DATABASE_URL.replace("/dbname", "/test_db")
-test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+test_engine = create_async_engine(TEST_DATABASE_URL, echo=False, poolclass=NullPool)
 TestSessionLocal = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
 TestBase = declarative_base()
 
 
+@contextmanager
+def count_statements(session):
+    """Collect the SQL statements a session sends to the database."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@contextmanager
+def assert_max_queries(limit: int):
+    """Fail if the block runs more than limit SQL statements, on any engine."""
+    with track_queries() as stats:
+        yield stats
+    if stats.count > limit:
+        statements = "\n".join(
+            f"{count}x {statement}"
+            for statement, count in stats.statements.most_common()
+        )
+        pytest.fail(
+            f"{stats.count} SQL statements, expected at most {limit}:\n{statements}"
+        )
+
+
+async def index_names(session, index: str) -> set[str]:
+    """An index's name and those of its copies on the table's partitions."""
+    result = await session.execute(
+        text(
+            "SELECT CAST(inhrelid AS regclass)::text FROM pg_inherits "
+            "WHERE inhparent = CAST(:index AS regclass)"
+        ),
+        {"index": index},
+    )
+    return {index, *result.scalars().all()}
+
+
 @pytest.fixture
 async def db_session():
     """Create a test database session."""
@@ -30,6 +84,21 @@ async def db_session():
         await conn.run_sync(TestBase.metadata.drop_all)
 
 
+@pytest.fixture
+async def schema_session():
+    """Create a test database session with the application schema."""
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with TestSessionLocal() as session:
+        yield session
+        await session.rollback()
+
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
 @pytest.fixture
 async def client(db_session):
     """Create a test client."""
@@ -37,6 +106,8 @@ async def client(db_session):
         yield db_session
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_snapshot_db] = override_get_db
     
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
@@ -0,0 +1,28 @@
+"""Settings parsing tests."""
+
+import pytest
+
+from app.core.config import Settings
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "postgresql+asyncpg://replica1/db,postgresql+asyncpg://replica2/db",
+        '["postgresql+asyncpg://replica1/db", "postgresql+asyncpg://replica2/db"]',
+    ],
+    ids=["comma-separated", "json"],
+)
+def test_read_urls_formats(monkeypatch, value):
+    """Test DATABASE_READ_URLS accepts comma-separated and JSON lists."""
+    monkeypatch.setenv("DATABASE_READ_URLS", value)
+    assert Settings().DATABASE_READ_URLS == [
+        "postgresql+asyncpg://replica1/db",
+        "postgresql+asyncpg://replica2/db",
+    ]
+
+
+def test_read_urls_empty(monkeypatch):
+    """Test an empty DATABASE_READ_URLS means no replicas."""
+    monkeypatch.setenv("DATABASE_READ_URLS", "")
+    assert Settings().DATABASE_READ_URLS == []
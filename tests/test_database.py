@@ -0,0 +1,484 @@
+"""Database session management tests."""
+
+import asyncio
+import re
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, event, exc, insert, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from starlette.requests import Request
+
+from app.db import database
+from app.db.database import track_queries
+from app.db.models.user import User
+from app.db.repositories.user_repository import UserRepository
+from tests.conftest import (
+    TEST_DATABASE_URL,
+    TestSessionLocal,
+    assert_max_queries,
+    test_engine,
+)
+
+
+def make_request(token: str = "token") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+            "client": ("127.0.0.1", 12345),
+        }
+    )
+
+
+@pytest.fixture
+def primary_engine(monkeypatch):
+    """Point the primary session factories at the test database."""
+    monkeypatch.setattr(database, "AsyncSessionLocal", TestSessionLocal)
+    monkeypatch.setattr(
+        database,
+        "AsyncReadSessionLocal",
+        database._create_read_session_factory(test_engine),
+    )
+    monkeypatch.setattr(
+        database,
+        "AsyncSnapshotSessionLocal",
+        database._create_read_session_factory(test_engine, snapshot=True),
+    )
+    return test_engine
+
+
+@pytest.fixture
+async def replica_engine(monkeypatch, primary_engine):
+    """Route reads to a second engine on the test database."""
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    monkeypatch.setattr(
+        database,
+        "read_session_factories",
+        [database._create_read_session_factory(engine)],
+    )
+    yield engine
+    await engine.dispose()
+
+
+async def read_session_pool(request: Request):
+    dependency = database.get_read_db(request)
+    session = await dependency.__anext__()
+    pool = session.bind.sync_engine.pool
+    await dependency.aclose()
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_reads_use_replica_until_requester_writes(replica_engine, schema_session):
+    """Test reads go to the replica, then stick to the primary after a write."""
+    writer = make_request("writer")
+    assert await read_session_pool(writer) is replica_engine.pool
+
+    dependency = database.get_db(writer)
+    session = await dependency.__anext__()
+    await UserRepository(session).update(
+        "00000000-0000-0000-0000-000000000000", is_active=True
+    )
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+
+    assert await read_session_pool(writer) is not replica_engine.pool
+    assert await read_session_pool(make_request("reader")) is replica_engine.pool
+
+
+@pytest.mark.asyncio
+async def test_read_only_session_is_not_flagged(schema_session):
+    """Test only sessions that ran DML are flagged as having written."""
+    repository = UserRepository(schema_session)
+    await repository.get_all()
+    assert not schema_session.info.get("has_writes")
+
+    await repository.create(
+        email="test@example.com", username="testuser", password_hash="hash"
+    )
+    assert schema_session.info.get("has_writes")
+
+
+@pytest.fixture
+def small_pool(monkeypatch):
+    """Engine factory settings for a one-connection pool."""
+    monkeypatch.setattr(database.settings, "DATABASE_POOL_SIZE", 1)
+    monkeypatch.setattr(database.settings, "DATABASE_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(database.settings, "DATABASE_POOL_TIMEOUT", 0.2)
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_track_checkouts_and_timeouts(small_pool):
+    """Test the pool reports checked-out connections, waits and timeouts."""
+    engine = database._create_engine(TEST_DATABASE_URL)
+    try:
+        async with engine.connect():
+            stats = engine.sync_engine.pool.stats()
+            assert stats["pool_size"] == 1
+            assert stats["checked_out"] == 1
+            assert stats["checkouts"] == 1
+
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+
+        stats = engine.sync_engine.pool.stats()
+        assert stats["checked_out"] == 0
+        assert stats["overflow"] == 0
+        assert stats["timeouts"] == 1
+        assert sum(stats["wait_ms_histogram"].values()) == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_db_skips_commit_without_writes(primary_engine, schema_session):
+    """Test request sessions that only read end without a COMMIT."""
+    commits = []
+    for write in (False, True):
+        dependency = database.get_db(make_request())
+        session = await dependency.__anext__()
+        original_commit = session.commit
+
+        async def commit():
+            commits.append(write)
+            await original_commit()
+
+        session.commit = commit
+        repository = UserRepository(session)
+        await repository.get_all()
+        if write:
+            await repository.update(
+                "00000000-0000-0000-0000-000000000000", is_active=True
+            )
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+
+    assert commits == [True]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "write",
+    [
+        text(
+            "INSERT INTO users (id, email, username, password_hash, is_active, "
+            "is_admin, role) VALUES (gen_random_uuid(), 'user@example.com', "
+            "'user', 'hash', true, false, 'user')"
+        ),
+        select(
+            insert(User)
+            .values(email="user@example.com", username="user", password_hash="hash")
+            .returning(User.id)
+            .cte("inserted")
+        ),
+    ],
+    ids=["text", "cte"],
+)
+async def test_get_db_commits_writes_the_orm_does_not_flag(
+    primary_engine, schema_session, write
+):
+    """Test textual DML and DML in CTEs are committed by get_db."""
+    dependency = database.get_db(make_request())
+    session = await dependency.__anext__()
+    await session.execute(write)
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+
+    async with test_engine.connect() as connection:
+        users = await connection.scalar(text("SELECT count(*) FROM users"))
+    assert users == 1
+
+
+@pytest.mark.asyncio
+async def test_get_db_runs_after_commit_callbacks(primary_engine, schema_session):
+    """Test after_commit callbacks see the committed rows, and skip rollbacks."""
+    seen = []
+
+    async def count_users():
+        async with test_engine.connect() as connection:
+            seen.append(await connection.scalar(text("SELECT count(*) FROM users")))
+
+    async def fail():
+        raise RuntimeError("cache unavailable")
+
+    dependency = database.get_db(make_request())
+    session = await dependency.__anext__()
+    session.add(User(email="user@example.com", username="user", password_hash="hash"))
+    # A failing callback is logged: the write has landed either way
+    database.after_commit(session, fail)
+    database.after_commit(session, count_users)
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+    assert seen == [1]
+
+    dependency = database.get_db(make_request())
+    session = await dependency.__anext__()
+    database.after_commit(session, count_users)
+    with pytest.raises(RuntimeError):
+        await dependency.athrow(RuntimeError())
+    assert seen == [1]
+
+
+async def open_read_session(dependency):
+    session = await dependency.__anext__()
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    return session, raw.driver_connection
+
+
+@pytest.mark.asyncio
+async def test_read_session_runs_statements_without_transaction(primary_engine):
+    """Test get_read_db reads in autocommit mode, with no BEGIN/COMMIT."""
+    dependency = database.get_read_db(make_request())
+    session, driver_connection = await open_read_session(dependency)
+    await session.execute(select(text("1")))
+    assert not driver_connection.is_in_transaction()
+    await dependency.aclose()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_session_is_read_only_repeatable_read(primary_engine):
+    """Test get_snapshot_db runs in one READ ONLY, REPEATABLE READ transaction."""
+    dependency = database.get_snapshot_db(make_request())
+    session, driver_connection = await open_read_session(dependency)
+    read_only = await session.scalar(text("SHOW transaction_read_only"))
+    isolation = await session.scalar(text("SHOW transaction_isolation"))
+    assert driver_connection.is_in_transaction()
+    assert (read_only, isolation) == ("on", "repeatable read")
+    await dependency.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dependency", [database.get_read_db, database.get_snapshot_db])
+async def test_read_sessions_reject_writes(primary_engine, schema_session, dependency):
+    """Test read-only sessions refuse DML and flushes."""
+    generator = dependency(make_request())
+    session = await generator.__anext__()
+    repository = UserRepository(session)
+
+    with pytest.raises(exc.InvalidRequestError):
+        await repository.update("00000000-0000-0000-0000-000000000000", is_active=True)
+    with pytest.raises(exc.InvalidRequestError):
+        await repository.create(
+            email="test@example.com", username="testuser", password_hash="hash"
+        )
+    session.expunge_all()
+    assert await session.scalar(select(User.id)) is None
+    await generator.aclose()
+
+
+async def run_across_server_swaps(engine) -> list:
+    """
+    Stand-in for PgBouncer transaction pooling.
+
+    Runs the same statement in consecutive transactions on one connection,
+    dropping every prepared statement in between, as happens when PgBouncer
+    hands the next transaction to a different server connection.
+    """
+    results = []
+    async with engine.connect() as connection:
+        for value in range(3):
+            result = await connection.execute(
+                text("SELECT CAST(:value AS integer) + 1"), {"value": value}
+            )
+            results.append(result.scalar())
+            await connection.commit()
+            await connection.exec_driver_sql("DEALLOCATE ALL")
+            await connection.commit()
+    return results
+
+
+@pytest.mark.asyncio
+async def test_default_mode_breaks_under_transaction_pooling():
+    """Test the stand-in reproduces the failure of cached statements."""
+    engine = database._create_engine(TEST_DATABASE_URL)
+    try:
+        with pytest.raises(exc.DBAPIError, match="prepared statement"):
+            await run_across_server_swaps(engine)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pgbouncer_mode_survives_transaction_pooling(monkeypatch):
+    """Test PgBouncer mode uses no cached or reused prepared statements."""
+    monkeypatch.setattr(database.settings, "DATABASE_PGBOUNCER", True)
+    engine = database._create_engine(TEST_DATABASE_URL)
+    try:
+        assert isinstance(engine.pool, NullPool)
+        assert await run_across_server_swaps(engine) == [1, 2, 3]
+
+        # Not asyncpg's per-client sequential names, which collide between
+        # clients sharing a server connection
+        async with engine.connect() as connection:
+            result = await connection.scalars(
+                text("SELECT name FROM pg_prepared_statements")
+            )
+            names = result.all()
+            assert names
+            assert all(not name.startswith("__asyncpg_stmt_") for name in names)
+        assert database._engine_pool_stats(engine) == {"pool_class": "NullPool"}
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+async def empty_database():
+    """Leave the test database without the application schema."""
+
+    async def drop():
+        async with test_engine.begin() as conn:
+            await conn.run_sync(database.Base.metadata.drop_all)
+            await conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+
+    await drop()
+    yield test_engine
+    await drop()
+
+
+@pytest.fixture
+def admin_settings(monkeypatch):
+    monkeypatch.setattr(database.settings, "ADMIN_EMAIL", "admin@example.com")
+    monkeypatch.setattr(database.settings, "ADMIN_USERNAME", "admin")
+    monkeypatch.setattr(database.settings, "ADMIN_PASSWORD", "admin-password")
+
+
+async def stamp(revision: str) -> None:
+    async with test_engine.begin() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+        await database._stamp(conn, [revision])
+
+
+@pytest.mark.asyncio
+async def test_init_db_sets_up_new_database_once(empty_database, admin_settings):
+    """Test concurrent workers create the schema and admin exactly once."""
+    await asyncio.gather(*(database.init_db(empty_database) for _ in range(4)))
+
+    heads, _ = database._schema_revisions()
+    async with TestSessionLocal() as session:
+        revisions = await session.scalars(
+            text("SELECT version_num FROM alembic_version")
+        )
+        assert set(revisions) == heads
+        admins = await session.scalars(select(User.username))
+        assert admins.all() == ["admin"]
+
+
+@pytest.mark.asyncio
+async def test_init_db_checks_schema_revision(empty_database):
+    """Test startup refuses outdated or unstamped schemas."""
+    await database.init_db(empty_database)
+
+    await stamp("006_composite_query_indexes")
+    with pytest.raises(RuntimeError, match="alembic upgrade head"):
+        await database.init_db(empty_database)
+
+    # Migrated by a newer release: keep serving
+    await stamp("999_from_the_future")
+    await database.init_db(empty_database)
+
+    async with test_engine.begin() as conn:
+        await conn.execute(text("DROP TABLE alembic_version"))
+    with pytest.raises(RuntimeError, match="alembic stamp head"):
+        await database.init_db(empty_database)
+
+
+@pytest.mark.asyncio
+async def test_init_db_skips_bootstrap_while_locked(empty_database, admin_settings):
+    """Test a worker skips the bootstrap another one is running, in 3 queries."""
+    await database.init_db(empty_database)
+    async with TestSessionLocal() as session:
+        await session.execute(delete(User))
+        await session.commit()
+
+    async with test_engine.connect() as holder:
+        await holder.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": database._INIT_LOCK_KEY}
+        )
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(
+            test_engine.sync_engine, "before_cursor_execute", before_cursor_execute
+        )
+        try:
+            await database.init_db(empty_database)
+        finally:
+            event.remove(
+                test_engine.sync_engine, "before_cursor_execute", before_cursor_execute
+            )
+        await holder.rollback()
+
+    # Schema check, revision and lock attempt, however many tables there are
+    assert len(statements) == 3
+    async with TestSessionLocal() as session:
+        assert await session.scalar(select(User)) is None
+
+    await database.init_db(empty_database)
+    async with TestSessionLocal() as session:
+        assert await session.scalar(select(User.username)) == "admin"
+
+
+async def run_statements(*statements: str) -> None:
+    async with test_engine.connect() as connection:
+        for statement in statements:
+            await connection.execute(text(statement))
+
+
+@pytest.mark.asyncio
+async def test_track_queries_counts_nested_blocks_and_tasks():
+    """Test statements count for every enclosing block, across tasks."""
+    with track_queries() as outer:
+        await run_statements("SELECT 1")
+        with track_queries() as inner:
+            await asyncio.gather(run_statements("SELECT 2"), run_statements("SELECT 2"))
+
+    assert (outer.count, inner.count) == (3, 2)
+    assert inner.repeated(1) == [("SELECT 2", 2)]
+    assert outer.duration >= inner.duration > 0
+
+
+async def query_endpoint(scope, receive, send):
+    await run_statements("SELECT 1", *["SELECT 2"] * 3)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+@pytest.mark.asyncio
+async def test_query_stats_middleware(monkeypatch, caplog):
+    """Test requests report their statements and warn over budget or on N+1."""
+    transport = ASGITransport(app=database.QueryStatsMiddleware(query_endpoint))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        with caplog.at_level("WARNING", logger=database.__name__):
+            response = await client.get("/dashboard")
+        assert not caplog.records
+
+        monkeypatch.setattr(database.settings, "DATABASE_QUERY_BUDGET", 3)
+        monkeypatch.setattr(database.settings, "DATABASE_QUERY_REPEAT_LIMIT", 2)
+        with caplog.at_level("WARNING", logger=database.__name__):
+            await client.get("/dashboard")
+
+    assert re.fullmatch(
+        r'db;dur=\d+\.\d;desc="4 queries"', response.headers["Server-Timing"]
+    )
+    budget, repeated = [record.getMessage() for record in caplog.records]
+    assert budget.startswith("GET /dashboard ran 4 SQL statements")
+    assert repeated == (
+        "GET /dashboard ran the same SQL statement 3 times (possible N+1): SELECT 2"
+    )
+
+
+@pytest.mark.asyncio
+async def test_assert_max_queries():
+    """Test the query count helper fails tests over their limit."""
+    with assert_max_queries(2):
+        await run_statements("SELECT 1", "SELECT 2")
+
+    with pytest.raises(pytest.fail.Exception, match="3 SQL statements"):
+        with assert_max_queries(2):
+            await run_statements("SELECT 1", "SELECT 2", "SELECT 3")
@@ -0,0 +1,395 @@
+"""Job posting service tests."""
+
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.schemas.job import (
+    JobPostingBatch,
+    JobPostingSearchResult,
+    JobPostingUpsert,
+)
+from app.core.config import settings
+from app.core.exceptions import BadRequestError
+from app.db import database
+from app.db.database import get_read_db
+from app.db.repositories.job_repository import JobPostingRepository
+from app.main import app
+from app.services.job_service import JobPostingService
+from app.utils.pagination import next_rank_cursor
+from tests.conftest import (
+    TestSessionLocal,
+    assert_max_queries,
+    count_statements,
+    index_names,
+    test_engine,
+)
+
+
+def upsert_payload(**overrides) -> JobPostingUpsert:
+    data = {
+        "url": "https://example.com/jobs/1",
+        "platform": "upwork",
+        "job_title": "Python developer",
+        "description": "Build an API",
+        "budget": 500,
+        "required_skills": ["python", "fastapi"],
+    }
+    data.update(overrides)
+    return JobPostingUpsert(**data)
+
+
+@pytest.mark.asyncio
+async def test_upsert_jobposting_inserts_then_updates(schema_session):
+    """Test the same URL is inserted once and updated afterwards."""
+    service = JobPostingService(schema_session)
+
+    created = await service.upsert_jobposting(upsert_payload())
+    assert created.created
+
+    updated = await service.upsert_jobposting(upsert_payload(job_title="Senior"))
+    assert not updated.created
+    assert updated.id == created.id
+    assert updated.job_title == "Senior"
+
+    partial = await service.upsert_jobposting(
+        JobPostingUpsert(url="https://example.com/jobs/1", budget=900)
+    )
+    assert partial.budget == 900
+    assert partial.job_title == "Senior"
+
+
+@pytest.mark.asyncio
+async def test_upsert_jobposting_partial_unknown_url(schema_session):
+    """Test a partial payload cannot create a new posting."""
+    service = JobPostingService(schema_session)
+
+    with pytest.raises(BadRequestError):
+        await service.upsert_jobposting(
+            JobPostingUpsert(url="https://example.com/jobs/404", budget=900)
+        )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_upserts_of_same_url(schema_session):
+    """Test concurrent ingestion of one URL never hits a unique violation."""
+
+    async def ingest(title: str):
+        async with TestSessionLocal() as session:
+            result = await JobPostingService(session).upsert_jobposting(
+                upsert_payload(job_title=title)
+            )
+            await session.commit()
+            return result
+
+    results = await asyncio.gather(*(ingest(f"Title {i}") for i in range(5)))
+
+    assert sum(result.created for result in results) == 1
+    assert len({result.id for result in results}) == 1
+
+
+@pytest.mark.asyncio
+async def test_unchanged_upsert_is_single_lookup(schema_session):
+    """Test re-ingesting identical content only reads the row."""
+    service = JobPostingService(schema_session)
+    created = await service.upsert_jobposting(upsert_payload())
+    assert created.changed
+
+    with count_statements(schema_session) as statements:
+        unchanged = await service.upsert_jobposting(upsert_payload())
+
+    assert len(statements) == 1
+    assert statements[0].startswith("SELECT")
+    assert not unchanged.created
+    assert not unchanged.changed
+    assert unchanged.id == created.id
+
+    with count_statements(schema_session) as statements:
+        partial = await service.upsert_jobposting(
+            JobPostingUpsert(url="https://example.com/jobs/1", budget=500)
+        )
+    assert len(statements) == 1
+    assert not partial.changed
+
+    changed = await service.upsert_jobposting(upsert_payload(budget=600))
+    assert changed.changed
+    assert not changed.created
+
+    moved = await service.upsert_jobposting(
+        upsert_payload(budget=600, platform="freelancer")
+    )
+    assert moved.changed
+    assert not moved.created
+
+
+@pytest.mark.asyncio
+async def test_batch_upsert_per_item_results(schema_session):
+    """Test a batch is written with one upsert and per-item results."""
+    service = JobPostingService(schema_session)
+    await service.upsert_jobposting(upsert_payload(budget=750))
+
+    items = [
+        {
+            "url": f"https://example.com/jobs/{i}",
+            "platform": "upwork",
+            "job_title": f"Job {i}",
+            "description": "Description",
+            "required_skills": ["python"],
+        }
+        for i in range(1, 4)
+    ]
+    items.append(dict(items[1], job_title="Duplicate wins"))
+
+    with count_statements(schema_session) as statements:
+        response = await service.upsert_jobpostings(JobPostingBatch(items=items))
+
+    # URL lookup, then one upsert for the changed and new rows
+    assert len(statements) == 2
+    assert [result.created for result in response.results] == [False, True, True, True]
+    assert response.results[1].id == response.results[3].id
+    assert response.created == 2
+    assert response.updated == 1
+    assert response.unchanged == 0
+
+    with count_statements(schema_session) as statements:
+        response = await service.upsert_jobpostings(JobPostingBatch(items=items))
+
+    assert len(statements) == 1
+    assert response.unchanged == 3
+    assert not any(result.changed for result in response.results)
+
+
+def test_batch_rejects_incomplete_or_oversized():
+    """Test the batch is validated as a whole."""
+    with pytest.raises(ValidationError):
+        JobPostingBatch(items=[{"url": "https://example.com/jobs/1"}])
+    with pytest.raises(ValidationError):
+        JobPostingBatch(items=[])
+
+
+@pytest.mark.asyncio
+async def test_summary_view_selects_description_preview(schema_session):
+    """Test view=summary reads a truncated preview instead of the description."""
+    service = JobPostingService(schema_session)
+    description = "word " * 2000
+    await service.upsert_jobposting(upsert_payload(description=description))
+
+    with count_statements(schema_session) as statements:
+        (summary,) = await service.get_jobpostings(skip=0, limit=10, view="summary")
+
+    assert statements[0].count("job_postings.description") == 1
+    assert "substr(job_postings.description" in statements[0]
+    assert len(summary.description_preview) == settings.LIST_PREVIEW_LENGTH
+    assert summary.description_preview.endswith("…")
+    assert description.startswith(summary.description_preview[:-1])
+
+
+@pytest.mark.asyncio
+async def test_upsert_endpoints_commit(schema_session, monkeypatch):
+    """Test POST /jobs and /jobs/batch persist through the real get_db."""
+    monkeypatch.setattr(database, "AsyncSessionLocal", TestSessionLocal)
+    payload = upsert_payload().model_dump(mode="json")
+    batch = {
+        "items": [
+            dict(payload, url="https://example.com/jobs/2"),
+            dict(payload, url="https://example.com/jobs/3"),
+        ]
+    }
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        created = await client.post(f"{settings.API_V1_PREFIX}/jobs", json=payload)
+        updated = await client.post(
+            f"{settings.API_V1_PREFIX}/jobs", json=dict(payload, job_title="Lead")
+        )
+        batched = await client.post(f"{settings.API_V1_PREFIX}/jobs/batch", json=batch)
+    assert created.json()["created"] and not updated.json()["created"]
+    assert batched.status_code == 200
+
+    async with test_engine.connect() as connection:
+        result = await connection.execute(
+            text("SELECT url, job_title FROM job_postings ORDER BY url")
+        )
+        assert result.all() == [
+            ("https://example.com/jobs/1", "Lead"),
+            ("https://example.com/jobs/2", "Python developer"),
+            ("https://example.com/jobs/3", "Python developer"),
+        ]
+        keys = await connection.scalar(text("SELECT count(*) FROM job_posting_keys"))
+        assert keys == 3
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_views(schema_session):
+    """Test GET /jobs returns full items by default and summaries on request."""
+    await JobPostingService(schema_session).upsert_jobposting(upsert_payload())
+
+    async def override_get_db():
+        yield schema_session
+
+    app.dependency_overrides[get_read_db] = override_get_db
+    try:
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            with assert_max_queries(1):
+                full = await client.get(f"{settings.API_V1_PREFIX}/jobs")
+            summary = await client.get(
+                f"{settings.API_V1_PREFIX}/jobs", params={"view": "summary"}
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert full.json()[0]["description"] == "Build an API"
+    assert "description_preview" not in full.json()[0]
+    assert summary.json()[0]["description_preview"] == "Build an API"
+    assert "description" not in summary.json()[0]
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_filters_and_pages(schema_session):
+    """Test search ranks title hits first, filters platforms and pages."""
+    service = JobPostingService(schema_session)
+    for payload in (
+        upsert_payload(
+            url="https://example.com/jobs/desc",
+            job_title="Backend developer",
+            description="Maintain Django services",
+        ),
+        upsert_payload(
+            url="https://example.com/jobs/title",
+            job_title="Django developer",
+            description="Build an API",
+        ),
+        upsert_payload(
+            url="https://example.com/jobs/other",
+            platform="freelancer",
+            job_title="Django consultant",
+        ),
+        upsert_payload(url="https://example.com/jobs/none"),
+    ):
+        await service.upsert_jobposting(payload)
+
+    results = await service.search_jobpostings("django")
+    assert {str(r.url) for r in results[:2]} == {
+        "https://example.com/jobs/other",
+        "https://example.com/jobs/title",
+    }
+    assert str(results[-1].url) == "https://example.com/jobs/desc"
+    assert results[0].rank > results[-1].rank
+
+    upwork = await service.search_jobpostings("django", platforms=["upwork"])
+    assert {str(r.url) for r in upwork} == {
+        "https://example.com/jobs/title",
+        "https://example.com/jobs/desc",
+    }
+
+    first = await service.search_jobpostings("django", limit=2)
+    rest = await service.search_jobpostings(
+        "django", limit=2, cursor=next_rank_cursor(first, 2)
+    )
+    assert [r.id for r in first + rest] == [r.id for r in results]
+
+
+@pytest.mark.asyncio
+async def test_search_uses_gin_index(schema_session):
+    """Test the search predicate is answered from the GIN index."""
+    query = JobPostingRepository(schema_session)._search_query(
+        "django", schema=JobPostingSearchResult
+    )
+    compiled = query.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+
+    # The table is tiny, so keep the planner from preferring a full scan
+    await schema_session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = await schema_session.scalars(text(f"EXPLAIN {compiled}"))
+    plan = "\n".join(plan)
+    indexes = await index_names(schema_session, "idx_job_postings_search_vector")
+    assert any(index in plan for index in indexes), plan
+
+
+@pytest.mark.asyncio
+async def test_skills_are_normalized(schema_session):
+    """Test skills are stored lowercased, trimmed and de-duplicated."""
+    job = await JobPostingService(schema_session).upsert_jobposting(
+        upsert_payload(required_skills=[" Python", "FastAPI", "python", ""])
+    )
+    assert job.required_skills == ["python", "fastapi"]
+
+    stored = await schema_session.scalar(
+        text("SELECT required_skills FROM job_postings WHERE id = :id"),
+        {"id": job.id},
+    )
+    assert stored == ["python", "fastapi"]
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_filters(schema_session):
+    """Test GET /jobs filters by skills, platform, budget and created_at."""
+    service = JobPostingService(schema_session)
+    for payload in (
+        upsert_payload(url="https://example.com/jobs/py"),
+        upsert_payload(
+            url="https://example.com/jobs/go",
+            platform="freelancer",
+            budget=2000,
+            required_skills=["go", "postgres"],
+        ),
+        upsert_payload(
+            url="https://example.com/jobs/both",
+            budget=1000,
+            required_skills=["python", "go"],
+        ),
+    ):
+        await service.upsert_jobposting(payload)
+
+    async def override_get_db():
+        yield schema_session
+
+    async def urls(**params):
+        response = await client.get(f"{settings.API_V1_PREFIX}/jobs", params=params)
+        assert response.status_code == 200
+        return {item["url"].rsplit("/", 1)[-1] for item in response.json()}
+
+    app.dependency_overrides[get_read_db] = override_get_db
+    try:
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            assert await urls(skills_all=["Python", "GO"]) == {"both"}
+            assert await urls(skills_any=["FastAPI", "postgres"]) == {"py", "go"}
+            assert await urls(platform="freelancer") == {"go"}
+            assert await urls(budget_min=800, budget_max=1500) == {"both"}
+            assert await urls(skills_any="go", budget_max=1000) == {"both"}
+            assert await urls(created_after="2000-01-01T00:00:00Z") == {
+                "py",
+                "go",
+                "both",
+            }
+            assert await urls(created_before="2000-01-01T00:00:00Z") == set()
+
+            invalid = await client.get(
+                f"{settings.API_V1_PREFIX}/jobs", params={"budget_min": -1}
+            )
+            assert invalid.status_code == 422
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("operator", ["@>", "?|"])
+async def test_skill_filters_use_gin_index(schema_session, operator):
+    """Test both skill filter operators are answered from the GIN index."""
+    value = """'["python"]'::jsonb""" if operator == "@>" else "array['python']"
+
+    # The table is tiny, so keep the planner from preferring a full scan
+    await schema_session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = await schema_session.scalars(
+        text(
+            "EXPLAIN SELECT id FROM job_postings "
+            f"WHERE required_skills {operator} {value}"
+        )
+    )
+    plan = "\n".join(plan)
+    indexes = await index_names(schema_session, "idx_job_postings_required_skills")
+    assert any(index in plan for index in indexes), plan
@@ -0,0 +1,75 @@
+"""Keyset pagination tests."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.exceptions import BadRequestError
+from app.db.models.job import PlatformEnum
+from app.db.repositories.job_repository import JobPostingRepository
+from app.utils.pagination import (
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+    next_cursor,
+)
+
+
+def test_cursor_roundtrip():
+    """Test cursors decode to the position they were built from."""
+    created_at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    job_id = "6f1c2f4e-1d2b-4c3a-9e8f-7a6b5c4d3e2f"
+    cursor = encode_cursor(created_at, job_id)
+
+    decoded_created_at, decoded_id = decode_cursor(cursor)
+    assert decoded_created_at == created_at
+    assert str(decoded_id) == job_id
+
+
+def test_rank_cursor_roundtrip():
+    """Test search cursors keep the exact float rank."""
+    rank = 0.0607927106320858
+    job_id = "6f1c2f4e-1d2b-4c3a-9e8f-7a6b5c4d3e2f"
+
+    decoded_rank, decoded_id = decode_rank_cursor(encode_rank_cursor(rank, job_id))
+    assert decoded_rank == rank
+    assert str(decoded_id) == job_id
+
+
+def test_invalid_cursor():
+    """Test malformed cursors are rejected as bad requests."""
+    with pytest.raises(BadRequestError):
+        decode_cursor("not-a-cursor")
+    with pytest.raises(BadRequestError):
+        decode_rank_cursor(encode_cursor(datetime.now(timezone.utc), "x"))
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_match_offset_pages(schema_session):
+    """Test walking cursors returns every row once, newest first."""
+    repository = JobPostingRepository(schema_session)
+    base_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(7):
+        await repository.create(
+            platform=PlatformEnum.upwork,
+            job_title=f"Job {i}",
+            description="Description",
+            required_skills=["python"],
+            url=f"https://example.com/jobs/{i}",
+            # Pairs share a timestamp so the id tie-breaker is exercised
+            created_at=base_time + timedelta(minutes=i // 2),
+        )
+
+    offset_rows = await repository.get_all(skip=0, limit=100)
+
+    keyset_rows, cursor = [], None
+    while True:
+        page = await repository.get_all(limit=3, cursor=cursor)
+        keyset_rows.extend(page)
+        cursor = next_cursor(page, 3)
+        if cursor is None:
+            break
+
+    assert [row.id for row in keyset_rows] == [row.id for row in offset_rows]
+    assert len(keyset_rows) == 7
@@ -0,0 +1,151 @@
+"""Job posting partition tests."""
+
+import csv
+import gzip
+import io
+from datetime import date, datetime, time, timezone
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError
+
+from app.db.models.application import Application
+from app.db.models.job import JobPostingKey, PlatformEnum
+from app.db.partitions import (
+    DEFAULT_PARTITION,
+    add_months,
+    create_partitions,
+    expired_partitions,
+    list_partitions,
+    maintain_partitions,
+    month_start,
+    partition_name,
+)
+from app.db.repositories.job_repository import JobPostingRepository
+from app.db.repositories.user_repository import UserRepository
+from tests.conftest import test_engine
+
+
+def job(url: str, created_at: datetime | None = None) -> dict:
+    values = {
+        "platform": PlatformEnum.upwork,
+        "job_title": "Job",
+        "description": "Description",
+        "required_skills": ["python"],
+        "url": url,
+    }
+    if created_at is not None:
+        values["created_at"] = created_at
+    return values
+
+
+def test_month_arithmetic():
+    """Test month helpers and retention cut-off."""
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert month_start(date(2026, 10, 18)) == date(2026, 10, 1)
+    assert partition_name(date(2026, 3, 1)) == "job_postings_y2026m03"
+
+    partitions = ["job_postings_y2026m03", "job_postings_y2026m04", DEFAULT_PARTITION]
+    assert expired_partitions(partitions, date(2026, 4, 1)) == ["job_postings_y2026m03"]
+
+
+@pytest.mark.asyncio
+async def test_url_stays_unique_across_partitions(schema_session):
+    """Test a URL cannot be stored twice, even in different partitions."""
+    repository = JobPostingRepository(schema_session)
+    await repository.create(
+        **job(
+            "https://example.com/jobs/1",
+            datetime(2020, 1, 1, tzinfo=timezone.utc),
+        )
+    )
+
+    with pytest.raises(IntegrityError):
+        await repository.create(**job("https://example.com/jobs/1"))
+
+
+@pytest.mark.asyncio
+async def test_maintenance_archives_expired_months(schema_session, tmp_path):
+    """Test expired months are exported, dropped and restorable by URL."""
+    today = datetime.now(timezone.utc).date()
+    old_month = add_months(month_start(today), -8)
+    old_time = datetime.combine(old_month, time(12), tzinfo=timezone.utc)
+
+    connection = await schema_session.connection()
+    await connection.run_sync(create_partitions, [old_month])
+    repository = JobPostingRepository(schema_session)
+    applied = await repository.create(
+        **job("https://example.com/jobs/applied", old_time)
+    )
+    await repository.create(**job("https://example.com/jobs/stale", old_time))
+    await repository.create(**job("https://example.com/jobs/current"))
+    user = await UserRepository(schema_session).create(
+        email="user@example.com", username="user", password_hash="hash"
+    )
+    schema_session.add(
+        Application(
+            user_id=user.id, job_posting_id=applied.id, proposal_content="Proposal"
+        )
+    )
+    await schema_session.commit()
+
+    result = await maintain_partitions(
+        test_engine, today=today, ahead=4, retention_months=6, archive_dir=tmp_path
+    )
+
+    assert result.created == [partition_name(add_months(month_start(today), 4))]
+    (archive,) = result.archived
+    assert archive == tmp_path / f"{partition_name(old_month)}.csv.gz"
+    with gzip.open(archive, "rt") as file:
+        rows = list(csv.DictReader(io.StringIO(file.read())))
+    assert {row["url"] for row in rows} == {
+        "https://example.com/jobs/applied",
+        "https://example.com/jobs/stale",
+    }
+    assert "search_vector" not in rows[0]
+
+    connection = await schema_session.connection()
+    partitions = await connection.run_sync(list_partitions)
+    assert partition_name(old_month) not in partitions
+    keys = await schema_session.scalars(select(JobPostingKey.url))
+    # The applied-to posting keeps its key, so the application survives
+    assert set(keys) == {
+        "https://example.com/jobs/applied",
+        "https://example.com/jobs/current",
+    }
+    assert await schema_session.scalar(select(Application.job_posting_id)) == applied.id
+
+    restored, inserted, changed = await repository.upsert_by_url(
+        **job("https://example.com/jobs/applied")
+    )
+    assert (restored.id, inserted, changed) == (applied.id, True, True)
+    assert await repository.count() == 2
+
+
+@pytest.mark.asyncio
+async def test_maintenance_detach_only(schema_session, tmp_path):
+    """Test detach-only keeps expired months as standalone tables."""
+    today = datetime.now(timezone.utc).date()
+    old_month = add_months(month_start(today), -8)
+
+    connection = await schema_session.connection()
+    await connection.run_sync(create_partitions, [old_month])
+    await schema_session.commit()
+
+    result = await maintain_partitions(
+        test_engine,
+        today=today,
+        retention_months=6,
+        archive_dir=tmp_path,
+        detach_only=True,
+    )
+
+    assert result.detached == [partition_name(old_month)]
+    assert not list(tmp_path.iterdir())
+    assert await schema_session.scalar(
+        text("SELECT to_regclass(:name) IS NOT NULL"),
+        {"name": partition_name(old_month)},
+    )
+    await schema_session.execute(text(f"DROP TABLE {partition_name(old_month)}"))
+    await schema_session.commit()
@@ -0,0 +1,481 @@
+"""Repository tests."""
+
+import asyncio
+import re
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, text
+
+from app.api.v1.schemas.application import ApplicationCreate
+from app.api.v1.schemas.auth import UserCreate
+from app.api.v1.schemas.job import (
+    JobPostingBrief,
+    JobPostingCreate,
+    JobPostingSearchResult,
+)
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.database import get_db, get_read_db
+from app.db.models.application import Application, ApplicationStatus
+from app.db.models.job import JobPostingKey, PlatformEnum
+from app.db.models.user import User, UserRole
+from app.db.repositories.application_repository import ApplicationRepository
+from app.db.repositories.job_repository import JobPostingRepository
+from app.db.repositories.user_repository import UserRepository
+from app.main import app
+from app.services.application_service import ApplicationService
+from app.services.auth_service import AuthService
+from app.services.job_service import JobPostingService
+from app.services.user_service import UserService
+from app.utils.pagination import encode_cursor
+from tests.conftest import TestSessionLocal, assert_max_queries, count_statements
+
+
+async def create_user(session, username: str = "testuser") -> User:
+    return await UserRepository(session).create(
+        email=f"{username}@example.com",
+        username=username,
+        password_hash="hash",
+    )
+
+
+async def create_application(session) -> Application:
+    user = await create_user(session)
+    job = await JobPostingRepository(session).create(
+        platform=PlatformEnum.upwork,
+        job_title="Job",
+        description="Description",
+        required_skills=["python"],
+        url="https://example.com/jobs/1",
+    )
+    return await ApplicationRepository(session).create(
+        user_id=user.id,
+        job_posting_id=job.id,
+        proposal_content="Proposal",
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_is_single_statement_with_ownership(schema_session):
+    """Test update runs one UPDATE ... RETURNING scoped by extra filters."""
+    application = await create_application(schema_session)
+    repository = ApplicationRepository(schema_session)
+    other_user = await create_user(schema_session, "otheruser")
+
+    with count_statements(schema_session) as statements:
+        updated = await repository.update(
+            application.id,
+            filters={"user_id": application.user_id},
+            status=ApplicationStatus.submitted,
+        )
+
+    assert len(statements) == 1
+    assert "RETURNING" in statements[0]
+    assert updated.status == ApplicationStatus.submitted
+    assert updated.updated_at is not None
+
+    assert (
+        await repository.update(
+            application.id,
+            filters={"user_id": other_user.id},
+            status=ApplicationStatus.lost,
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_is_single_statement_with_ownership(schema_session):
+    """Test delete runs one DELETE ... RETURNING scoped by extra filters."""
+    application = await create_application(schema_session)
+    repository = ApplicationRepository(schema_session)
+    other_user = await create_user(schema_session, "otheruser")
+
+    assert not await repository.delete(
+        application.id, filters={"user_id": other_user.id}
+    )
+
+    with count_statements(schema_session) as statements:
+        deleted = await repository.delete(
+            application.id, filters={"user_id": application.user_id}
+        )
+
+    assert deleted
+    assert len(statements) == 1
+    assert await repository.get_by_id(application.id) is None
+
+
+@pytest.mark.asyncio
+async def test_create_paths_are_single_insert(schema_session):
+    """Test create paths return server defaults from the INSERT itself."""
+    user = await create_user(schema_session)
+
+    with count_statements(schema_session) as statements:
+        job = await JobPostingService(schema_session).create_jobposting(
+            JobPostingCreate(
+                platform=PlatformEnum.upwork,
+                job_title="Job",
+                description="Description",
+                required_skills=["python"],
+                url="https://example.com/jobs/1",
+            )
+        )
+    assert len(statements) == 1
+    assert job.created_at is not None
+
+    with count_statements(schema_session) as statements:
+        application = await ApplicationService(schema_session).create_application(
+            user.id,
+            ApplicationCreate(
+                job_posting_id=job.id,
+                proposal_content="Proposal",
+                bid_amount=None,
+                milestones=None,
+                submitted_at=None,
+            ),
+        )
+    assert len(statements) == 1
+    assert application.created_at is not None
+    assert application.updated_at is not None
+
+    with count_statements(schema_session) as statements:
+        registered = await AuthService(schema_session).register_user(
+            UserCreate(
+                username="newuser",
+                email="newuser@example.com",
+                password="testpassword123",
+                full_name="New User",
+                skills=["python"],
+                experience_summary="Summary",
+                portfolio_links=[],
+                preferred_rate=50,
+            )
+        )
+    # Email and username checks, then the INSERT
+    assert len(statements) == 3
+    assert statements[-1].startswith("INSERT")
+    assert registered.created_at is not None
+
+
+def job_rows(count: int, title: str = "Job") -> list[dict]:
+    return [
+        {
+            "platform": PlatformEnum.upwork,
+            "job_title": f"{title} {i}",
+            "description": "Description",
+            "required_skills": ["python"],
+            "url": f"https://example.com/jobs/{i}",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_batches_lookups(schema_session):
+    """Test lookups in one tick share a query per model and are cached."""
+    application = await create_application(schema_session)
+    other = await create_user(schema_session, "other")
+    await schema_session.commit()
+    missing = uuid4()
+
+    async with TestSessionLocal() as session:
+        users = UserRepository(session)
+        jobs = JobPostingRepository(session)
+
+        with count_statements(session) as statements:
+            found = await asyncio.gather(
+                users.get_by_id(application.user_id),
+                users.get_by_id(other.id),
+                users.get_by_id(missing),
+                jobs.get_by_id(application.job_posting_id),
+            )
+        assert [getattr(row, "id", None) for row in found] == [
+            application.user_id,
+            other.id,
+            None,
+            application.job_posting_id,
+        ]
+        assert len(statements) == 2
+        assert all("= ANY (" in statement for statement in statements)
+
+        # Hits and misses are cached for the rest of the request, also
+        # when looked up by string
+        with count_statements(session) as statements:
+            assert await users.get_by_id(missing) is None
+            assert await users.get_by_id(str(other.id)) is found[1]
+            assert await users.get_many_by_ids(
+                [other.id, missing, application.user_id, other.id]
+            ) == [found[1], found[0]]
+        assert statements == []
+
+        assert await users.delete(other.id)
+        with count_statements(session) as statements:
+            assert await users.get_by_id(other.id) is None
+        assert statements == []
+
+        # Rolled back rows may be gone, so they are looked up again
+        await session.rollback()
+        with count_statements(session) as statements:
+            assert (await users.get_by_id(other.id)).id == other.id
+        assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_chunks_rows(schema_session):
+    """Test bulk_create inserts all rows in chunked multi-row statements."""
+    repository = JobPostingRepository(schema_session)
+
+    with count_statements(schema_session) as statements:
+        result = await repository.bulk_create(job_rows(5), chunk_size=2)
+
+    assert len(statements) == 3
+    assert result.inserted == 5
+    assert len(set(result.ids)) == 5
+    assert await repository.count() == 5
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_reports_inserted_and_updated(schema_session):
+    """Test bulk_upsert splits inserted and updated rows."""
+    repository = JobPostingRepository(schema_session)
+    existing = await repository.bulk_create(job_rows(3))
+
+    rows = job_rows(5, title="Updated")
+    rows.append(dict(rows[0], job_title="Updated twice"))
+    result = await repository.bulk_upsert(
+        rows, conflict_columns=["url"], update_columns=["job_title"]
+    )
+
+    assert result.inserted == 2
+    assert result.updated == 3
+    assert set(existing.ids) <= set(result.ids)
+
+    job = await repository.get_by_url("https://example.com/jobs/0")
+    await schema_session.refresh(job)
+    assert job.job_title == "Updated twice"
+
+    skipped = await repository.bulk_upsert(job_rows(6), conflict_columns=["url"])
+    assert skipped.inserted == 1
+    assert skipped.updated == 0
+
+
+@pytest.mark.asyncio
+async def test_exists_with_many_matches(schema_session):
+    """Test exists() reads no rows and tolerates several matches."""
+    repository = JobPostingRepository(schema_session)
+    await repository.bulk_create(job_rows(3))
+
+    with count_statements(schema_session) as statements:
+        assert await repository.exists(platform=PlatformEnum.upwork)
+    assert "EXISTS" in statements[0]
+    assert not await repository.exists(platform=PlatformEnum.freelancer)
+
+
+@pytest.mark.asyncio
+async def test_count_modes(schema_session):
+    """Test exact, cached and estimated counts."""
+    repository = JobPostingRepository(schema_session)
+    await repository.bulk_create(job_rows(50))
+    await schema_session.commit()
+    await schema_session.execute(text("ANALYZE job_postings"))
+
+    assert await repository.count() == 50
+    assert await repository.count(mode="estimated") == 50
+    assert await repository.count(mode="estimated", platform=PlatformEnum.upwork) == 50
+    assert await repository.count(mode="estimated", job_title="Job :1 at 50%") <= 1
+
+    assert await repository.count(mode="cached", job_title="Job 1") == 1
+    await repository.bulk_create(
+        [dict(job_rows(1)[0], url="https://example.com/jobs/extra", job_title="Job 1")]
+    )
+    assert await repository.count(job_title="Job 1") == 2
+    assert await repository.count(mode="cached", job_title="Job 1") == 1
+
+
+@pytest.mark.asyncio
+async def test_list_queries_project_onto_response_schema(schema_session):
+    """Test list queries select only response columns and skip the ORM."""
+    application = await create_application(schema_session)
+    schema_session.expunge_all()
+
+    with count_statements(schema_session) as statements:
+        users = await UserService(schema_session).get_users(limit=10)
+        applications = await ApplicationService(schema_session).get_applications(
+            application.user_id
+        )
+
+    assert [user.username for user in users] == ["testuser"]
+    assert [app.id for app in applications] == [application.id]
+    assert "password_hash" not in statements[0]
+    assert len(schema_session.identity_map) == 0
+
+
+@pytest.mark.asyncio
+async def test_application_summary_view(schema_session):
+    """Test view=summary returns a proposal preview and no proposal text."""
+    application = await create_application(schema_session)
+
+    (summary,) = await ApplicationService(schema_session).get_applications(
+        application.user_id, view="summary"
+    )
+
+    assert summary.proposal_preview == "Proposal"
+    assert not hasattr(summary, "proposal_content")
+
+
+@pytest.mark.asyncio
+async def test_applications_include_job(schema_session):
+    """Test include=job embeds postings in one request and one list query."""
+    application = await create_application(schema_session)
+    # An application whose posting has been archived
+    archived = JobPostingKey(id=uuid4(), url="https://example.com/jobs/archived")
+    schema_session.add(archived)
+    await schema_session.flush()
+    schema_session.add(
+        Application(
+            user_id=application.user_id,
+            job_posting_id=archived.id,
+            proposal_content="Proposal",
+        )
+    )
+    await schema_session.commit()
+    schema_session.expunge_all()
+    token = create_access_token({"user_id": str(application.user_id)})
+
+    async def override_get_db():
+        yield schema_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    try:
+        async with AsyncClient(
+            app=app,
+            base_url="http://test",
+            headers={"Authorization": f"Bearer {token}"},
+        ) as client:
+            # The principal lookup, then the applications joined with their
+            # postings
+            with assert_max_queries(2) as stats:
+                full = await client.get(
+                    f"{settings.API_V1_PREFIX}/applications", params={"include": "job"}
+                )
+            summary = await client.get(
+                f"{settings.API_V1_PREFIX}/applications",
+                params={"include": "job", "view": "summary"},
+            )
+            plain = await client.get(f"{settings.API_V1_PREFIX}/applications")
+    finally:
+        app.dependency_overrides.clear()
+
+    (query,) = [
+        statement for statement in stats.statements if "applications" in statement
+    ]
+    assert "LEFT OUTER JOIN job_postings" in query
+    assert "job_postings.description" not in query
+
+    jobs = {item["job_posting_id"]: item["job"] for item in full.json()}
+    assert jobs[str(archived.id)] is None
+    job = jobs[str(application.job_posting_id)]
+    assert (job["job_title"], job["url"]) == ("Job", "https://example.com/jobs/1")
+    (summary_item,) = [item for item in summary.json() if item["job"]]
+    assert summary_item["job"]["id"] == str(application.job_posting_id)
+    assert summary_item["proposal_preview"] == "Proposal"
+    assert "proposal_content" not in summary_item
+    assert [item["job"] for item in plain.json()] == [None, None]
+
+
+@contextmanager
+def capture_queries(session):
+    """Collect (statement, parameters) pairs a session sends to the database."""
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args):
+        queries.append((statement, parameters))
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+REPOSITORY_QUERIES = {
+    "applications by user": lambda s, user: ApplicationRepository(s).get_by_user_id(
+        user.id
+    ),
+    "applications by user, oldest first": lambda s, user: ApplicationRepository(
+        s
+    ).get_by_user_id(user.id, sort="asc"),
+    "applications by user and status": lambda s, user: ApplicationRepository(
+        s
+    ).get_by_user_id(user.id, status=ApplicationStatus.submitted),
+    "applications by user, next page": lambda s, user: ApplicationRepository(
+        s
+    ).get_by_user_id(
+        user.id, cursor=encode_cursor(datetime.now(timezone.utc), user.id)
+    ),
+    "applications by user with jobs": lambda s, user: ApplicationRepository(
+        s
+    ).get_by_user_id(user.id, job_schema=JobPostingBrief),
+    "application by id": lambda s, user: ApplicationRepository(s).get_by_application_id(
+        user.id, user.id
+    ),
+    "job postings": lambda s, user: JobPostingRepository(s).get_all(),
+    "job postings by platform": lambda s, user: JobPostingRepository(s).get_filtered(
+        platforms=[PlatformEnum.upwork]
+    ),
+    "job postings by skills": lambda s, user: JobPostingRepository(s).get_filtered(
+        skills_all=["python"]
+    ),
+    "job postings by budget": lambda s, user: JobPostingRepository(s).get_filtered(
+        budget_min=100, budget_max=200
+    ),
+    "job posting by url": lambda s, user: JobPostingRepository(s).get_by_url(
+        "https://example.com/jobs/1"
+    ),
+    "job posting search": lambda s, user: JobPostingRepository(s).search(
+        "python", schema=JobPostingSearchResult
+    ),
+    "job postings by ids": lambda s, user: JobPostingRepository(s).get_many_by_ids(
+        [uuid4(), uuid4()]
+    ),
+    "users by ids": lambda s, user: UserRepository(s).get_many_by_ids([uuid4()]),
+    "user by email": lambda s, user: UserRepository(s).get_by_email(user.email),
+    "user by email or username": lambda s, user: UserRepository(
+        s
+    ).get_by_email_or_username(user.username),
+    "users by role": lambda s, user: UserRepository(s).get_by_role(UserRole.ADMIN),
+    "users": lambda s, user: UserRepository(s).get_all(),
+}
+
+# Ordered by relevance, which only a sort over the index matches can produce
+RANKED_QUERIES = {"job posting search"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", REPOSITORY_QUERIES)
+async def test_repository_queries_use_indexes(schema_session, name):
+    """Test list and lookup queries are index scans that need no sort step."""
+    application = await create_application(schema_session)
+    user = await schema_session.get(User, application.user_id)
+
+    with capture_queries(schema_session) as queries:
+        await REPOSITORY_QUERIES[name](schema_session, user)
+
+    # The tables are tiny, so keep the planner from preferring a full scan
+    # (or a full scan plus sort) over the index it would use at scale
+    await schema_session.execute(text("SET LOCAL enable_seqscan = off"))
+    await schema_session.execute(text("SET LOCAL enable_sort = off"))
+    connection = await schema_session.connection()
+    for statement, parameters in queries:
+        result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        plan = "\n".join(row[0] for row in result)
+        assert "Seq Scan" not in plan, plan
+        if name not in RANKED_QUERIES:
+            # Merge Append's "Sort Key" is fine, a Sort node is not
+            assert not re.search(r"Sort\s+\(", plan), plan
@@ -0,0 +1,116 @@
+"""Security utility tests."""
+
+import asyncio
+import time
+import uuid
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from app.core import security
+from app.core.exceptions import ServiceUnavailableError
+from app.core.principal_cache import PrincipalCache
+from app.core.security import (
+    PasswordHashPool,
+    VerifiedTokenCache,
+    create_access_token,
+    decode_token,
+    get_password_hash_async,
+    verified_token_cache,
+    verify_password_async,
+)
+from app.utils.cache import TTLCache
+
+
+@pytest.mark.asyncio
+async def test_password_hash_async_roundtrip():
+    """Test hashing and verifying through the worker pool."""
+    hashed = await get_password_hash_async("testpassword123")
+    assert await verify_password_async("testpassword123", hashed)
+    assert not await verify_password_async("wrongpassword", hashed)
+
+
+@pytest.mark.asyncio
+async def test_password_hash_pool_rejects_when_full():
+    """Test the pool fails fast once its admission queue is full."""
+    pool = PasswordHashPool(max_workers=1, max_pending=1)
+
+    tasks = [asyncio.create_task(pool.run(time.sleep, 0.2)) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert pool.in_flight == 2
+
+    with pytest.raises(ServiceUnavailableError):
+        await pool.run(time.sleep, 0)
+
+    await asyncio.gather(*tasks)
+    assert pool.in_flight == 0
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_hit_miss_and_invalidate():
+    """Test principal cache counters and explicit invalidation."""
+    cache = PrincipalCache(maxsize=10, ttl=60, local_ttl=60)
+    user_id = uuid.uuid4()
+
+    assert await cache.get(user_id) is None
+    await cache.set(user_id, {"role": "user", "is_admin": False})
+    assert await cache.get(user_id) == {"role": "user", "is_admin": False}
+
+    await cache.invalidate(user_id)
+    assert await cache.get(user_id) is None
+
+    stats = cache.stats()
+    assert stats["local_hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["invalidations"] == 1
+
+
+def test_ttl_cache_expires_and_evicts():
+    """Test TTL expiry and LRU eviction of the in-process cache."""
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=60, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.set("d", 4, ttl=10)
+    now[0] = 9
+    assert cache.get("d") == 4
+    now[0] = 10
+    assert cache.get("d") is None
+
+
+def test_decode_token_memoizes_verified_claims():
+    """Test repeated decodes are served from the cache as copies."""
+    token = create_access_token({"sub": "testuser"})
+    hits = verified_token_cache.hits
+
+    payload = decode_token(token)
+    payload["role"] = "admin"
+
+    assert decode_token(token)["sub"] == "testuser"
+    assert "role" not in decode_token(token)
+    assert verified_token_cache.hits == hits + 2
+
+
+def test_decode_token_never_serves_expired(monkeypatch):
+    """Test tokens past exp are re-verified and rejected."""
+    token = create_access_token({"sub": "testuser"}, timedelta(seconds=-1))
+    claims = jwt.get_unverified_claims(token)
+    now = [claims["exp"] - 10.0]
+    cache = VerifiedTokenCache(maxsize=10, clock=lambda: now[0])
+    monkeypatch.setattr(security, "verified_token_cache", cache)
+
+    cache.set(token, claims)
+    assert decode_token(token)["sub"] == "testuser"
+
+    now[0] = claims["exp"]
+    with pytest.raises(HTTPException):
+        decode_token(token)
+    assert cache.misses == 1
@@ -0,0 +1,44 @@
+"""User endpoint tests."""
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.core.principal_cache import principal_cache
+from app.core.security import create_access_token
+from app.db import database
+from app.db.models.user import User
+from app.main import app
+from tests.conftest import TestSessionLocal
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["PATCH", "PUT"])
+async def test_profile_update_invalidates_principal(
+    schema_session, monkeypatch, method
+):
+    """Test profile updates commit and drop the cached principal."""
+    monkeypatch.setattr(database, "AsyncSessionLocal", TestSessionLocal)
+    user = User(email="user@example.com", username="user", password_hash="hash")
+    schema_session.add(user)
+    await schema_session.commit()
+    token = create_access_token({"sub": user.username, "user_id": str(user.id)})
+    await principal_cache.set(user.id, {"role": "user", "is_admin": False})
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.request(
+            method,
+            f"{settings.API_V1_PREFIX}/users/me",
+            json={
+                "email": "user@example.com",
+                "username": "user",
+                "full_name": "New Name",
+                "skills": [],
+                "portfolio_links": [],
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "New Name"
+    assert await principal_cache.get(user.id) is None